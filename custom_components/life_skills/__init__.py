@@ -6,14 +6,32 @@ from typing import Any, Dict
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.typing import ConfigType
 
 from homeassistant.components.frontend import add_extra_js_url
 
+from .const import (
+    CONF_PERSONS,
+    DATA_LEADERBOARDS,
+    DATA_SCHEDULER,
+    DATA_SOURCES,
+    DATA_UNLOCK_STORE,
+    OVERALL_LEADERBOARD_UNIQUE_ID,
+    SIGNAL_MIDNIGHT_SWEEP,
+)
+from .sensor import skill_slug
+from .leaderboard import LeaderboardManager
+from .scheduler import HabitScheduler
 from .services import async_setup_services, async_unload_services
+from .sources import XpSourceManager
+from .unlock_store import UnlockStore
+from .websocket_api import async_setup_websocket_api
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +49,59 @@ CONFIG_SCHEMA = vol.Schema(
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Life Skills component."""
     hass.data.setdefault(DOMAIN, {})
+
+    @callback
+    def _midnight_sweep(now) -> None:
+        """Let every skill materialize decay and streak changes once a day."""
+        async_dispatcher_send(hass, SIGNAL_MIDNIGHT_SWEEP)
+
+    # A single timer for all skills; decay is otherwise evaluated lazily
+    async_track_time_change(hass, _midnight_sweep, hour=0, minute=0, second=0)
+
+    # Leaderboards are shared by all entries, the XP numbers keep them up to date
+    hass.data[DATA_LEADERBOARDS] = LeaderboardManager(hass)
+
+    # The overall leaderboard used to be added without a config entry, which
+    # left it on installs without people and impossible to remove
+    entity_registry = er.async_get(hass)
+    if (
+        entity_id := entity_registry.async_get_entity_id("sensor", DOMAIN, OVERALL_LEADERBOARD_UNIQUE_ID)
+    ) is not None and entity_registry.async_get(entity_id).config_entry_id is None:
+        entity_registry.async_remove(entity_id)
+
+    # Recurring grants share one timer, re-armed to the next due schedule
+    scheduler = HabitScheduler(hass)
+    await scheduler.async_load()
+    hass.data[DATA_SCHEDULER] = scheduler
+
+    # Bound sensors are aggregated per window before their XP is granted
+    sources = XpSourceManager(hass)
+    await sources.async_load()
+    hass.data[DATA_SOURCES] = sources
+
+    @callback
+    def _stop_sources(event) -> None:
+        """Stop granting source XP while the skills are shutting down."""
+        sources.async_stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _stop_sources)
+
+    # Unlocks of every skill share one file, read once here instead of per skill
+    unlock_store = UnlockStore(hass)
+    await unlock_store.async_load(
+        {
+            entry.entry_id: [
+                skill_slug(skill.get("name", "Unknown"), person)
+                for skill in entry.data.get("skills", [])
+                for person in skill.get(CONF_PERSONS) or [None]
+            ]
+            for entry in hass.config_entries.async_entries(DOMAIN)
+        }
+    )
+    hass.data[DATA_UNLOCK_STORE] = unlock_store
+
+    # The card fetches unlocks per level instead of parsing every unlock
+    async_setup_websocket_api(hass)
     return True
 
 
@@ -77,3 +148,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await async_unload_services(hass)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the unlocks of a deleted config entry."""
+    if (unlock_store := hass.data.get(DATA_UNLOCK_STORE)) is not None:
+        unlock_store.async_remove_entry(entry.entry_id)
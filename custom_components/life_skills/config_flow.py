@@ -6,6 +6,19 @@ from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
+from .const import (
+    CONF_COMPACT,
+    CONF_DECAY_GRACE_DAYS,
+    CONF_PERSONS,
+    CONF_DECAY_RATE,
+    CONF_STREAK_BONUS,
+    CONF_STREAK_MAX_DAYS,
+    DEFAULT_DECAY_GRACE_DAYS,
+    DEFAULT_DECAY_RATE,
+    DEFAULT_STREAK_BONUS,
+    DEFAULT_STREAK_MAX_DAYS,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "life_skills"
@@ -20,9 +33,20 @@ class LifeSkillsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             skill_name = user_input.get("skill_name", "Programming")
             skill_icon = user_input.get("skill_icon", "mdi:star")
+            skill = {
+                "name": skill_name,
+                "icon": skill_icon,
+                "xp": 0,
+                CONF_DECAY_RATE: user_input.get(CONF_DECAY_RATE, DEFAULT_DECAY_RATE),
+                CONF_DECAY_GRACE_DAYS: user_input.get(CONF_DECAY_GRACE_DAYS, DEFAULT_DECAY_GRACE_DAYS),
+                CONF_STREAK_BONUS: user_input.get(CONF_STREAK_BONUS, DEFAULT_STREAK_BONUS),
+                CONF_STREAK_MAX_DAYS: user_input.get(CONF_STREAK_MAX_DAYS, DEFAULT_STREAK_MAX_DAYS),
+                CONF_PERSONS: user_input.get(CONF_PERSONS, []),
+                CONF_COMPACT: user_input.get(CONF_COMPACT, False),
+            }
             return self.async_create_entry(
                 title=skill_name,
-                data={"skills": [{"name": skill_name, "icon": skill_icon, "xp": 0}]},
+                data={"skills": [skill]},
             )
 
         return self.async_show_form(
@@ -30,5 +54,21 @@ class LifeSkillsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=vol.Schema({
                 vol.Required("skill_name", default="Programming"): str,
                 vol.Optional("skill_icon", default="mdi:code-tags"): selector.IconSelector(),
+                vol.Optional(CONF_PERSONS, default=[]): selector.EntitySelector(
+                    selector.EntitySelectorConfig(domain="person", multiple=True)
+                ),
+                vol.Optional(CONF_COMPACT, default=False): bool,
+                vol.Optional(CONF_DECAY_RATE, default=DEFAULT_DECAY_RATE): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=100)
+                ),
+                vol.Optional(CONF_DECAY_GRACE_DAYS, default=DEFAULT_DECAY_GRACE_DAYS): vol.All(
+                    vol.Coerce(int), vol.Range(min=0)
+                ),
+                vol.Optional(CONF_STREAK_BONUS, default=DEFAULT_STREAK_BONUS): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=100)
+                ),
+                vol.Optional(CONF_STREAK_MAX_DAYS, default=DEFAULT_STREAK_MAX_DAYS): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
             }),
         )
@@ -1,3 +1,42 @@
 """Constants for the Life Skills integration."""
 
 DOMAIN = "life_skills"
+
+# XP curve: level n needs sum of (n + multiplier * 2^(n / growth)) / divisor
+DEFAULT_CURVE_MULTIPLIER = 300
+DEFAULT_CURVE_GROWTH = 7
+DEFAULT_CURVE_DIVISOR = 4
+MAX_LEVEL = 1000
+
+# Per-skill decay and streak options
+CONF_DECAY_RATE = "decay_rate"
+CONF_DECAY_GRACE_DAYS = "decay_grace_days"
+CONF_STREAK_BONUS = "streak_bonus"
+CONF_STREAK_MAX_DAYS = "streak_max_days"
+
+DEFAULT_DECAY_RATE = 0
+DEFAULT_DECAY_GRACE_DAYS = 3
+DEFAULT_STREAK_BONUS = 0
+DEFAULT_STREAK_MAX_DAYS = 7
+
+# Skills tracked for several people, one set of entities per person entity
+CONF_PERSONS = "persons"
+
+# One entity per skill, with level, XP to next and unlocks as attributes
+CONF_COMPACT = "compact"
+
+# Dispatcher signals
+SIGNAL_GRANT_XP = "life_skills_grant_xp_{}"
+SIGNAL_SET_XP = "life_skills_set_xp_{}"
+SIGNAL_MIDNIGHT_SWEEP = "life_skills_midnight_sweep"
+SIGNAL_LEADERBOARD_UPDATED = "life_skills_leaderboard_updated_{}"
+SIGNAL_OVERALL_LEADERBOARD_UPDATED = "life_skills_overall_leaderboard_updated"
+
+# Domain wide data
+DATA_SCHEDULER = "life_skills_scheduler"
+DATA_SOURCES = "life_skills_sources"
+DATA_UNLOCK_SENSORS = "life_skills_unlock_sensors"
+DATA_UNLOCK_STORE = "life_skills_unlock_store"
+DATA_LEADERBOARDS = "life_skills_leaderboards"
+
+OVERALL_LEADERBOARD_UNIQUE_ID = "life_skills_overall_leaderboard"
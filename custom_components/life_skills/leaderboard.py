@@ -0,0 +1,120 @@
+"""Leaderboards for Life Skills integration."""
+import logging
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import SIGNAL_LEADERBOARD_UPDATED, SIGNAL_OVERALL_LEADERBOARD_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Leaderboard:
+    """Scores of members kept in ranked order.
+
+    The ranking is a sorted list of (-score, member) pairs, so a score change
+    is a binary search to drop the old pair and another to insert the new one
+    instead of re-sorting every member.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the leaderboard."""
+        self._scores: Dict[str, float] = {}
+        self._ranking: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        """Return the number of members."""
+        return len(self._ranking)
+
+    def __contains__(self, member: str) -> bool:
+        """Return True if the member is on the leaderboard."""
+        return member in self._scores
+
+    def score(self, member: str, default: float = 0) -> float:
+        """Return the score of a member."""
+        return self._scores.get(member, default)
+
+    def update(self, member: str, score: float) -> bool:
+        """Set the score of a member, return False if it didn't change."""
+        old = self._scores.get(member)
+        if old == score:
+            return False
+
+        if old is not None:
+            del self._ranking[bisect_left(self._ranking, (-old, member))]
+        self._scores[member] = score
+        insort(self._ranking, (-score, member))
+        return True
+
+    def remove(self, member: str) -> bool:
+        """Remove a member, return False if it isn't on the leaderboard."""
+        old = self._scores.pop(member, None)
+        if old is None:
+            return False
+
+        del self._ranking[bisect_left(self._ranking, (-old, member))]
+        return True
+
+    def rank(self, member: str) -> Optional[int]:
+        """Return the 1-based rank of a member."""
+        if member not in self._scores:
+            return None
+        return bisect_left(self._ranking, (-self._scores[member], member)) + 1
+
+    def ranking(self) -> List[Tuple[str, float]]:
+        """Return (member, score) pairs, highest score first."""
+        return [(member, -score) for score, member in self._ranking]
+
+
+class LeaderboardManager:
+    """Keep a leaderboard per skill and an overall one of total XP per person.
+
+    The overall leaderboard sensor belongs to one of the config entries that
+    track people, overall_platforms holds the add entities callback of each.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manager."""
+        self.hass = hass
+        self.overall = Leaderboard()
+        self.overall_sensor: Optional[Any] = None
+        self.overall_platforms: Dict[str, Callable] = {}
+        self._skills: Dict[str, Leaderboard] = {}
+
+    def skill(self, skill_name: str) -> Leaderboard:
+        """Return the leaderboard of a skill."""
+        skill_slug = skill_name.lower().replace(' ', '_')
+        if skill_slug not in self._skills:
+            self._skills[skill_slug] = Leaderboard()
+        return self._skills[skill_slug]
+
+    @callback
+    def async_update(self, skill_name: str, person: str, xp: float) -> None:
+        """Record the XP of a person in a skill and notify the leaderboard sensors."""
+        board = self.skill(skill_name)
+        old = board.score(person)
+        if not board.update(person, xp):
+            return
+
+        # Only the changed person moves, in both leaderboards
+        self.overall.update(person, self.overall.score(person) + xp - old)
+        async_dispatcher_send(self.hass, SIGNAL_LEADERBOARD_UPDATED.format(skill_name.lower().replace(' ', '_')))
+        async_dispatcher_send(self.hass, SIGNAL_OVERALL_LEADERBOARD_UPDATED)
+
+    @callback
+    def async_remove(self, skill_name: str, person: str) -> None:
+        """Remove a person from a skill, for example when its entity is removed."""
+        board = self.skill(skill_name)
+        old = board.score(person)
+        if not board.remove(person):
+            return
+
+        total = self.overall.score(person) - old
+        if any(person in skill_board for skill_board in self._skills.values()):
+            self.overall.update(person, total)
+        else:
+            self.overall.remove(person)
+        async_dispatcher_send(self.hass, SIGNAL_LEADERBOARD_UPDATED.format(skill_name.lower().replace(' ', '_')))
+        async_dispatcher_send(self.hass, SIGNAL_OVERALL_LEADERBOARD_UPDATED)
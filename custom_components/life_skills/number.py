@@ -1,12 +1,43 @@
 """Number platform for Life Skills integration."""
 import logging
+from datetime import date, timedelta
 from typing import Any, Dict, Optional
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_COMPACT,
+    CONF_DECAY_GRACE_DAYS,
+    CONF_PERSONS,
+    CONF_DECAY_RATE,
+    CONF_STREAK_BONUS,
+    CONF_STREAK_MAX_DAYS,
+    DATA_LEADERBOARDS,
+    DATA_UNLOCK_STORE,
+    DEFAULT_DECAY_GRACE_DAYS,
+    DEFAULT_DECAY_RATE,
+    DEFAULT_STREAK_BONUS,
+    DEFAULT_STREAK_MAX_DAYS,
+    SIGNAL_GRANT_XP,
+    SIGNAL_MIDNIGHT_SWEEP,
+    SIGNAL_SET_XP,
+)
+from .sensor import (
+    SkillUnlocksMixin,
+    calculate_decayed_xp,
+    calculate_level_from_xp,
+    calculate_streak_bonus,
+    calculate_xp_to_next_level,
+    person_label,
+    skill_slug,
+)
+from .unlock_store import UnlockStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,61 +49,269 @@ async def async_setup_entry(
 ) -> None:
     """Set up Life Skills number platform."""
     skills = config_entry.data.get("skills", [])
-    
+
     entities = []
-    
+
     # Create XP number for each skill
     for skill in skills:
         skill_name = skill.get("name", "Unknown")
         skill_icon = skill.get("icon", "mdi:star")
         initial_xp = skill.get("xp", 0)
-        
-        entities.append(LifeSkillXpNumber(config_entry.entry_id, skill_name, skill_icon, initial_xp))
-    
+
+        # Skills tracked for several people get one XP number per person
+        for person in skill.get(CONF_PERSONS) or [None]:
+            if skill.get(CONF_COMPACT):
+                entities.append(
+                    LifeSkillCompactXpNumber(
+                        config_entry.entry_id,
+                        skill_name,
+                        skill_icon,
+                        initial_xp,
+                        hass.data[DATA_UNLOCK_STORE],
+                        skill,
+                        person,
+                    )
+                )
+            else:
+                entities.append(
+                    LifeSkillXpNumber(config_entry.entry_id, skill_name, skill_icon, initial_xp, skill, person)
+                )
+
     async_add_entities(entities)
 
 
+@callback
+def async_grant_xp(hass: HomeAssistant, skill_name: str, amount: int, person: Optional[str] = None) -> bool:
+    """Grant XP to a skill through its number entity, return False if it doesn't exist."""
+    slug = skill_slug(skill_name, person)
+    if hass.states.get(f"number.{slug}_xp") is None:
+        return False
+
+    # The number entity applies pending decay and streak bonuses itself
+    async_dispatcher_send(hass, SIGNAL_GRANT_XP.format(slug), amount)
+    return True
+
+
+@callback
+def async_set_xp(hass: HomeAssistant, skill_name: str, value: float, person: Optional[str] = None) -> bool:
+    """Set the XP of a skill with a single state write, return False if it doesn't exist."""
+    slug = skill_slug(skill_name, person)
+    if hass.states.get(f"number.{slug}_xp") is None:
+        return False
+
+    async_dispatcher_send(hass, SIGNAL_SET_XP.format(slug), value)
+    return True
+
+
 class LifeSkillXpNumber(NumberEntity, RestoreEntity):
-    """Number entity for skill XP."""
+    """Number entity for skill XP.
+
+    Decay and streaks are evaluated lazily from the stored XP and the date of
+    the last grant, so idle skills need no timers of their own.
+    """
 
-    def __init__(self, entry_id: str, skill_name: str, skill_icon: str, initial_xp: int) -> None:
+    def __init__(
+        self,
+        entry_id: str,
+        skill_name: str,
+        skill_icon: str,
+        initial_xp: int,
+        options: Optional[Dict[str, Any]] = None,
+        person: Optional[str] = None,
+    ) -> None:
         """Initialize the number entity."""
+        options = options or {}
         self._entry_id = entry_id
         self._skill_name = skill_name
+        self._person = person
+        self._skill_slug = skill_slug(skill_name, person)
         self._skill_icon = skill_icon
         self._initial_xp = initial_xp
-        
-        self._attr_name = f"{skill_name} XP"
-        self._attr_unique_id = f"{entry_id}_{skill_name}_xp"
+        self._decay_rate = options.get(CONF_DECAY_RATE, DEFAULT_DECAY_RATE)
+        self._decay_grace_days = options.get(CONF_DECAY_GRACE_DAYS, DEFAULT_DECAY_GRACE_DAYS)
+        self._streak_bonus = options.get(CONF_STREAK_BONUS, DEFAULT_STREAK_BONUS)
+        self._streak_max_days = options.get(CONF_STREAK_MAX_DAYS, DEFAULT_STREAK_MAX_DAYS)
+
+        # XP as of the decay anchor, the day of the last grant or manual set
+        self._base_xp = initial_xp
+        self._decay_anchor: Optional[date] = None
+        self._last_grant: Optional[date] = None
+        self._streak = 0
+        self._materialized: Optional[tuple] = None
+
+        if person:
+            self._attr_name = f"{person_label(person)} {skill_name} XP"
+            self._attr_unique_id = f"{entry_id}_{person}_{skill_name}_xp"
+        else:
+            self._attr_name = f"{skill_name} XP"
+            self._attr_unique_id = f"{entry_id}_{skill_name}_xp"
         self._attr_icon = skill_icon
         self._attr_native_min_value = 0
         self._attr_native_max_value = 999999
         self._attr_native_step = 1
-        self._attr_native_value = initial_xp
         self._attr_native_unit_of_measurement = "XP"
         self._attr_mode = "box"
 
+    @property
+    def native_value(self) -> float:
+        """Return the current XP with any pending decay applied."""
+        return self._effective_xp(dt_util.now().date())
+
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return extra attributes."""
+        today = dt_util.now().date()
         return {
             "skill_name": self._skill_name,
+            "person": self._person,
             "entry_id": self._entry_id,
+            "base_xp": self._base_xp,
+            "decay_anchor": self._decay_anchor.isoformat() if self._decay_anchor else None,
+            "last_grant": self._last_grant.isoformat() if self._last_grant else None,
+            "streak": self._current_streak(today),
         }
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        
+
         # Restore previous state
         if (restored := await self.async_get_last_state()) is not None:
             if restored.state and restored.state != "unknown":
                 try:
-                    self._attr_native_value = float(restored.state)
+                    self._base_xp = float(restored.attributes.get("base_xp", restored.state))
                 except (ValueError, TypeError):
-                    self._attr_native_value = self._initial_xp
+                    self._base_xp = self._initial_xp
+            self._decay_anchor = dt_util.parse_date(restored.attributes.get("decay_anchor") or "")
+            self._last_grant = dt_util.parse_date(restored.attributes.get("last_grant") or "")
+            self._streak = int(restored.attributes.get("streak") or 0)
+
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_GRANT_XP.format(self._skill_slug), self.async_grant_xp)
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_SET_XP.format(self._skill_slug), self.async_set_xp)
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_MIDNIGHT_SWEEP, self._handle_midnight_sweep)
+        )
+
+        if self._person:
+            self._update_leaderboard(self._effective_xp(dt_util.now().date()))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """When entity will be removed from hass."""
+        if self._person and DATA_LEADERBOARDS in self.hass.data:
+            self.hass.data[DATA_LEADERBOARDS].async_remove(self._skill_name, self._person)
+
+    @callback
+    def _update_leaderboard(self, xp: float) -> None:
+        """Move this person on the skill and overall leaderboards."""
+        if DATA_LEADERBOARDS in self.hass.data:
+            self.hass.data[DATA_LEADERBOARDS].async_update(self._skill_name, self._person, xp)
+
+    def _idle_days(self, today: date) -> int:
+        """Return the number of idle days past the grace period."""
+        if self._decay_anchor is None:
+            return 0
+        return max(0, (today - self._decay_anchor).days - self._decay_grace_days)
+
+    def _effective_xp(self, today: date) -> float:
+        """Return the stored XP with decay applied up to the given day."""
+        return calculate_decayed_xp(self._base_xp, self._idle_days(today), self._decay_rate)
+
+    def _current_streak(self, today: date) -> int:
+        """Return the streak length, or 0 if it was broken before today."""
+        if self._last_grant is None or today - self._last_grant > timedelta(days=1):
+            return 0
+        return self._streak
+
+    @callback
+    def _async_write_xp_state(self, today: date) -> None:
+        """Write state and remember what was materialized."""
+        self._materialized = (self._effective_xp(today), self._current_streak(today))
+        self.async_write_ha_state()
+        if self._person:
+            self._update_leaderboard(self._materialized[0])
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
-        self._attr_native_value = value
-        self.async_write_ha_state()
+        self.async_set_xp(value)
+
+    @callback
+    def async_set_xp(self, value: float) -> None:
+        """Set XP and restart the decay clock."""
+        self._base_xp = value
+        self._decay_anchor = dt_util.now().date()
+        self._async_write_xp_state(self._decay_anchor)
+
+    @callback
+    def async_grant_xp(self, amount: int) -> None:
+        """Grant XP, applying pending decay first and any streak bonus."""
+        today = dt_util.now().date()
+        if self._last_grant != today:
+            self._streak = self._current_streak(today) + 1
+            self._last_grant = today
+
+        bonus = calculate_streak_bonus(amount, self._streak, self._streak_bonus, self._streak_max_days)
+        self._base_xp = self._effective_xp(today) + amount + bonus
+        self._decay_anchor = today
+        self._async_write_xp_state(today)
+
+        if bonus:
+            _LOGGER.debug("%s streak of %d days added %d bonus XP", self._skill_name, self._streak, bonus)
+
+    @callback
+    def _handle_midnight_sweep(self) -> None:
+        """Materialize decay and streak changes that happened since the last write."""
+        today = dt_util.now().date()
+        if self._materialized != (self._effective_xp(today), self._current_streak(today)):
+            self._async_write_xp_state(today)
+
+
+class LifeSkillCompactXpNumber(SkillUnlocksMixin, LifeSkillXpNumber):
+    """Number entity for skill XP that also carries level, XP to next and unlocks.
+
+    Replaces the level, XP to next and unlocks sensors of a skill, so a grant
+    is a single state write.
+    """
+
+    # The summary only changes with the catalog, unlike the XP attributes
+    # next to it, so keep it out of every recorded grant
+    _unrecorded_attributes = frozenset({"unlock_summary", "unlocks_revision"})
+
+    def __init__(
+        self,
+        entry_id: str,
+        skill_name: str,
+        skill_icon: str,
+        initial_xp: int,
+        unlock_store: UnlockStore,
+        options: Optional[Dict[str, Any]] = None,
+        person: Optional[str] = None,
+    ) -> None:
+        """Initialize the number entity."""
+        super().__init__(entry_id, skill_name, skill_icon, initial_xp, options, person)
+        self._init_unlocks(unlock_store)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return extra attributes."""
+        xp = int(self.native_value)
+        return {
+            **super().extra_state_attributes,
+            "level": calculate_level_from_xp(xp),
+            "xp_to_next": calculate_xp_to_next_level(xp),
+            "unlock_summary": self.get_unlock_summary(),
+            "unlocks_revision": self._unlocks_revision,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self._async_setup_unlocks()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """When entity will be removed from hass."""
+        await super().async_will_remove_from_hass()
+        self._async_remove_unlocks()
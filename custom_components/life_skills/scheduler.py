@@ -0,0 +1,176 @@
+"""Recurring XP grants for Life Skills integration."""
+import heapq
+import itertools
+import logging
+from datetime import datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.const import WEEKDAYS
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .number import async_grant_xp
+
+_LOGGER = logging.getLogger(__name__)
+STORAGE_VERSION = 1
+STORAGE_KEY = "life_skills_schedules"
+
+
+def calculate_next_due(schedule: Dict[str, Any], after: datetime) -> datetime:
+    """Calculate the first time strictly after the given moment a schedule is due."""
+    if schedule.get("every") is not None:
+        # Interval schedules stay aligned to their start, also across restarts
+        interval = timedelta(seconds=schedule["every"])
+        start = dt_util.parse_datetime(schedule["start"])
+        if after < start:
+            return start
+        periods = (after - start) // interval + 1
+        return start + periods * interval
+
+    at = time.fromisoformat(schedule["at"])
+    weekdays = schedule.get("weekdays") or WEEKDAYS
+    local_after = dt_util.as_local(after)
+    for offset in range(8):
+        day = local_after.date() + timedelta(days=offset)
+        if WEEKDAYS[day.weekday()] not in weekdays:
+            continue
+        due = datetime.combine(day, at, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        if due > local_after:
+            return due
+
+    raise ValueError(f"Schedule {schedule['schedule_id']} is never due")
+
+
+class HabitScheduler:
+    """Run every recurring grant from one min-heap and a single timer.
+
+    The heap holds (due, sequence, schedule_id, generation) entries. Removing or
+    replacing a schedule bumps its generation, which makes stale heap entries
+    drop out when they are popped instead of searching the heap for them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._schedules: Dict[str, Dict[str, Any]] = {}
+        self._generations: Dict[str, int] = {}
+        self._heap: List[Tuple[datetime, int, str, int]] = []
+        self._sequence = itertools.count()
+        self._unsub_timer: Optional[CALLBACK_TYPE] = None
+        self._armed_for: Optional[datetime] = None
+
+    @property
+    def schedules(self) -> Dict[str, Dict[str, Any]]:
+        """Return all schedules keyed by schedule id."""
+        return self._schedules
+
+    async def async_load(self) -> None:
+        """Load schedules from storage and arm the timer."""
+        data = await self._store.async_load()
+        now = dt_util.utcnow()
+        for schedule in (data or {}).get("schedules", []):
+            try:
+                due = calculate_next_due(schedule, now)
+            except (KeyError, TypeError, ValueError, ZeroDivisionError) as err:
+                # One broken schedule shouldn't keep every skill from loading
+                _LOGGER.error("Skipping stored schedule %s: %s", schedule.get("schedule_id"), err)
+                continue
+            self._schedules[schedule["schedule_id"]] = schedule
+            self._push(schedule["schedule_id"], due)
+        self._arm()
+
+    async def _save(self) -> None:
+        """Save schedules to storage."""
+        await self._store.async_save({"schedules": list(self._schedules.values())})
+
+    async def async_add_schedule(self, schedule: Dict[str, Any]) -> datetime:
+        """Add or replace a schedule, return when it is next due."""
+        if schedule.get("every") is not None and "start" not in schedule:
+            schedule["start"] = dt_util.utcnow().isoformat()
+
+        # Computed first so a schedule that can't be due is never stored
+        due = calculate_next_due(schedule, dt_util.utcnow())
+        schedule_id = schedule["schedule_id"]
+        self._schedules[schedule_id] = schedule
+        self._generations[schedule_id] = self._generations.get(schedule_id, 0) + 1
+        self._push(schedule_id, due)
+        self._arm()
+        await self._save()
+        return due
+
+    async def async_remove_schedule(self, schedule_id: str) -> bool:
+        """Remove a schedule, return False if it doesn't exist."""
+        if self._schedules.pop(schedule_id, None) is None:
+            return False
+
+        # Its heap entry is now stale and is discarded when it comes up
+        self._generations[schedule_id] = self._generations.get(schedule_id, 0) + 1
+        await self._save()
+        return True
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+            self._armed_for = None
+
+    def _push(self, schedule_id: str, due: datetime) -> None:
+        """Push the next occurrence of a schedule onto the heap."""
+        heapq.heappush(
+            self._heap,
+            (due, next(self._sequence), schedule_id, self._generations.setdefault(schedule_id, 0)),
+        )
+
+    @callback
+    def _arm(self) -> None:
+        """Make sure the single timer fires for the earliest heap entry."""
+        if not self._heap:
+            self.async_stop()
+            return
+
+        due = self._heap[0][0]
+        if self._armed_for is not None and self._armed_for <= due:
+            return
+
+        self.async_stop()
+        self._armed_for = due
+        self._unsub_timer = async_track_point_in_time(self.hass, self._async_fire, due)
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Apply every grant that is due, batched per skill, and re-arm."""
+        self._unsub_timer = None
+        self._armed_for = None
+
+        grants: Dict[Tuple[str, Optional[str]], int] = {}
+        while self._heap and self._heap[0][0] <= now:
+            due, _, schedule_id, generation = heapq.heappop(self._heap)
+            schedule = self._schedules.get(schedule_id)
+            if schedule is None or self._generations.get(schedule_id) != generation:
+                continue
+
+            if self._condition_met(schedule):
+                key = (schedule["skill_name"], schedule.get("person"))
+                grants[key] = grants.get(key, 0) + schedule["amount"]
+            self._push(schedule_id, calculate_next_due(schedule, max(due, now)))
+
+        for (skill_name, person), amount in grants.items():
+            if async_grant_xp(self.hass, skill_name, amount, person):
+                _LOGGER.debug("Scheduled grant of %d XP to %s", amount, skill_name)
+            else:
+                _LOGGER.warning("Scheduled grant skipped, skill %s not found", skill_name)
+
+        self._arm()
+
+    def _condition_met(self, schedule: Dict[str, Any]) -> bool:
+        """Check the optional entity state condition of a schedule."""
+        condition_entity = schedule.get("condition_entity")
+        if not condition_entity:
+            return True
+        state = self.hass.states.get(condition_entity)
+        return state is not None and state.state == schedule.get("condition_state", "home")
@@ -1,20 +1,35 @@
 """Sensor platform for Life Skills integration."""
 import logging
 import math
-import json
+from bisect import bisect_right
 from typing import Any, Dict, Optional
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, callback, split_entity_id
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.helpers.storage import Store
+
+from .const import (
+    CONF_COMPACT,
+    CONF_PERSONS,
+    DATA_LEADERBOARDS,
+    DATA_UNLOCK_SENSORS,
+    DATA_UNLOCK_STORE,
+    DEFAULT_CURVE_DIVISOR,
+    DEFAULT_CURVE_GROWTH,
+    DEFAULT_CURVE_MULTIPLIER,
+    MAX_LEVEL,
+    OVERALL_LEADERBOARD_UNIQUE_ID,
+    SIGNAL_LEADERBOARD_UPDATED,
+    SIGNAL_OVERALL_LEADERBOARD_UPDATED,
+)
+from .leaderboard import Leaderboard
+from .unlock_store import UnlockStore
 
 _LOGGER = logging.getLogger(__name__)
-STORAGE_VERSION = 1
-STORAGE_KEY = "life_skills_unlocks"
 
 
 async def async_setup_entry(
@@ -27,17 +42,72 @@ async def async_setup_entry(
     
     entities = []
     
+    unlock_store = hass.data[DATA_UNLOCK_STORE]
+    
     # Create level, xp_to_next, and unlocks sensors for each skill
     for skill in skills:
         skill_name = skill.get("name", "Unknown")
         skill_icon = skill.get("icon", "mdi:star")
+        persons = skill.get(CONF_PERSONS) or []
         
-        entities.append(LifeSkillLevelSensor(config_entry.entry_id, skill_name, skill_icon))
-        entities.append(LifeSkillXpToNextSensor(config_entry.entry_id, skill_name, skill_icon))
-        entities.append(LifeSkillUnlocksSensor(config_entry.entry_id, skill_name, skill_icon))
+        # Skills tracked for several people get one set of sensors per person,
+        # compact skills keep everything on their XP number
+        for person in [] if skill.get(CONF_COMPACT) else persons or [None]:
+            entities.append(LifeSkillLevelSensor(config_entry.entry_id, skill_name, skill_icon, person))
+            entities.append(LifeSkillXpToNextSensor(config_entry.entry_id, skill_name, skill_icon, person))
+            entities.append(
+                LifeSkillUnlocksSensor(config_entry.entry_id, skill_name, skill_icon, unlock_store, person)
+            )
+        
+        if persons:
+            entities.append(
+                LifeSkillLeaderboardSensor(
+                    hass.data[DATA_LEADERBOARDS].skill(skill_name),
+                    f"{config_entry.entry_id}_{skill_name}_leaderboard",
+                    skill_name,
+                    skill_icon,
+                )
+            )
     
     async_add_entities(entities)
 
+    # The overall leaderboard spans every entry, only one that tracks people adds it
+    if any(skill.get(CONF_PERSONS) for skill in skills):
+        manager = hass.data[DATA_LEADERBOARDS]
+        manager.overall_platforms[config_entry.entry_id] = async_add_entities
+
+        @callback
+        def _remove_overall_platform() -> None:
+            """Stop offering this entry for the overall leaderboard."""
+            manager.overall_platforms.pop(config_entry.entry_id, None)
+
+        config_entry.async_on_unload(_remove_overall_platform)
+        async_add_overall_leaderboard(hass)
+
+
+@callback
+def async_add_overall_leaderboard(hass: HomeAssistant) -> None:
+    """Add the overall leaderboard through an entry that tracks people, unless it exists."""
+    manager = hass.data[DATA_LEADERBOARDS]
+    if manager.overall_sensor is not None or not manager.overall_platforms:
+        return
+
+    manager.overall_sensor = LifeSkillLeaderboardSensor(manager.overall, OVERALL_LEADERBOARD_UNIQUE_ID)
+    next(iter(manager.overall_platforms.values()))([manager.overall_sensor])
+
+
+def skill_slug(skill_name: str, person: Optional[str] = None) -> str:
+    """Return the slug used in the entity ids of a skill, prefixed with the person if it has one."""
+    slug = skill_name.lower().replace(' ', '_')
+    if person:
+        return f"{split_entity_id(person)[1]}_{slug}"
+    return slug
+
+
+def person_label(person: str) -> str:
+    """Return a display label for a person entity id, used in entity names."""
+    return split_entity_id(person)[1].replace('_', ' ').title()
+
 
 def calculate_level_from_xp(xp: int) -> int:
     """Calculate level based on XP using custom formula."""
@@ -61,7 +131,12 @@ def calculate_level_from_xp(xp: int) -> int:
     return level
 
 
-def calculate_xp_for_level(level: int) -> int:
+def calculate_xp_for_level(
+    level: int,
+    multiplier: float = DEFAULT_CURVE_MULTIPLIER,
+    growth: float = DEFAULT_CURVE_GROWTH,
+    divisor: float = DEFAULT_CURVE_DIVISOR,
+) -> int:
     """Calculate XP required for a specific level."""
     if level <= 1:
         return 0
@@ -70,10 +145,39 @@ def calculate_xp_for_level(level: int) -> int:
     total_sum = 0
     
     for n in range(1, level):
-        term = n + 300 * (2 ** (n / 7))
+        term = n + multiplier * (2 ** (n / growth))
         total_sum += term
     
-    return int(total_sum / 4)
+    return int(total_sum / divisor)
+
+
+def calculate_xp_thresholds(
+    max_level: int = MAX_LEVEL,
+    multiplier: float = DEFAULT_CURVE_MULTIPLIER,
+    growth: float = DEFAULT_CURVE_GROWTH,
+    divisor: float = DEFAULT_CURVE_DIVISOR,
+) -> list:
+    """Calculate the XP required for every level up to max_level in one pass.
+
+    Element i matches calculate_xp_for_level(i + 1) for the same curve.
+    Raises ValueError if the curve overflows before max_level.
+    """
+    thresholds = [0]
+    total_sum = 0
+
+    for n in range(1, max_level):
+        try:
+            total_sum += n + multiplier * (2 ** (n / growth))
+            thresholds.append(int(total_sum / divisor))
+        except OverflowError as err:
+            raise ValueError(f"XP curve overflows at level {n + 1}") from err
+
+    return thresholds
+
+
+def calculate_levels_from_xp(xp_values: list, thresholds: list) -> list:
+    """Calculate the level for a batch of XP values against precomputed thresholds."""
+    return [bisect_right(thresholds, xp) for xp in xp_values]
 
 
 def calculate_xp_to_next_level(current_xp: int) -> int:
@@ -83,16 +187,42 @@ def calculate_xp_to_next_level(current_xp: int) -> int:
     return max(0, next_level_xp - current_xp)
 
 
+def calculate_decayed_xp(xp: int, idle_days: int, decay_rate: float) -> int:
+    """Calculate XP after decaying for a number of idle days.
+
+    Each idle day removes decay_rate percent of the progress made within the
+    current level, so a skill never decays below the level it has reached.
+    """
+    if xp <= 0 or idle_days <= 0 or decay_rate <= 0:
+        return xp
+
+    level_floor = calculate_xp_for_level(calculate_level_from_xp(xp))
+    progress = xp - level_floor
+    return int(level_floor + progress * (1 - min(decay_rate, 100) / 100) ** idle_days)
+
+
+def calculate_streak_bonus(amount: int, streak: int, bonus: float, max_days: int) -> int:
+    """Calculate bonus XP for a grant made on the given day of a streak."""
+    if amount <= 0 or streak <= 1 or bonus <= 0:
+        return 0
+
+    return int(amount * min(streak - 1, max_days) * bonus / 100)
+
+
 class LifeSkillLevelSensor(SensorEntity, RestoreEntity):
     """Sensor for skill level."""
 
-    def __init__(self, entry_id: str, skill_name: str, skill_icon: str) -> None:
+    def __init__(self, entry_id: str, skill_name: str, skill_icon: str, person: Optional[str] = None) -> None:
         """Initialize the sensor."""
         self._entry_id = entry_id
         self._skill_name = skill_name
         self._skill_icon = skill_icon
-        self._attr_name = f"{skill_name} Level"
-        self._attr_unique_id = f"{entry_id}_{skill_name}_level"
+        self._person = person
+        self._skill_slug = skill_slug(skill_name, person)
+        prefix = f"{person_label(person)} " if person else ""
+        unique_prefix = f"{entry_id}_{person}" if person else entry_id
+        self._attr_name = f"{prefix}{skill_name} Level"
+        self._attr_unique_id = f"{unique_prefix}_{skill_name}_level"
         self._attr_icon = skill_icon
         self._attr_native_unit_of_measurement = "level"
         self._state = 1
@@ -107,6 +237,7 @@ class LifeSkillLevelSensor(SensorEntity, RestoreEntity):
         """Return extra attributes."""
         return {
             "skill_name": self._skill_name,
+            "person": self._person,
             "entry_id": self._entry_id,
         }
 
@@ -118,7 +249,7 @@ class LifeSkillLevelSensor(SensorEntity, RestoreEntity):
         self.async_on_remove(
             async_track_state_change_event(
                 self.hass,
-                f"number.{self._skill_name.lower().replace(' ', '_')}_xp",
+                f"number.{self._skill_slug}_xp",
                 self._handle_xp_change,
             )
         )
@@ -149,13 +280,17 @@ class LifeSkillLevelSensor(SensorEntity, RestoreEntity):
 class LifeSkillXpToNextSensor(SensorEntity, RestoreEntity):
     """Sensor for XP needed to reach next level."""
 
-    def __init__(self, entry_id: str, skill_name: str, skill_icon: str) -> None:
+    def __init__(self, entry_id: str, skill_name: str, skill_icon: str, person: Optional[str] = None) -> None:
         """Initialize the sensor."""
         self._entry_id = entry_id
         self._skill_name = skill_name
         self._skill_icon = skill_icon
-        self._attr_name = f"{skill_name} XP to Next"
-        self._attr_unique_id = f"{entry_id}_{skill_name}_xp_to_next"
+        self._person = person
+        self._skill_slug = skill_slug(skill_name, person)
+        prefix = f"{person_label(person)} " if person else ""
+        unique_prefix = f"{entry_id}_{person}" if person else entry_id
+        self._attr_name = f"{prefix}{skill_name} XP to Next"
+        self._attr_unique_id = f"{unique_prefix}_{skill_name}_xp_to_next"
         self._attr_icon = "mdi:arrow-up-bold"
         self._attr_native_unit_of_measurement = "XP"
         self._state = 83  # Default XP needed for level 2
@@ -170,6 +305,7 @@ class LifeSkillXpToNextSensor(SensorEntity, RestoreEntity):
         """Return extra attributes."""
         return {
             "skill_name": self._skill_name,
+            "person": self._person,
             "entry_id": self._entry_id,
         }
 
@@ -181,7 +317,7 @@ class LifeSkillXpToNextSensor(SensorEntity, RestoreEntity):
         self.async_on_remove(
             async_track_state_change_event(
                 self.hass,
-                f"number.{self._skill_name.lower().replace(' ', '_')}_xp",
+                f"number.{self._skill_slug}_xp",
                 self._handle_xp_change,
             )
         )
@@ -209,49 +345,27 @@ class LifeSkillXpToNextSensor(SensorEntity, RestoreEntity):
                 pass
 
 
-class LifeSkillUnlocksSensor(SensorEntity, RestoreEntity):
-    """Sensor for skill unlocks at current level."""
+class SkillUnlocksMixin:
+    """Unlock catalog of a skill, for the unlocks sensor and compact skills.
 
-    def __init__(self, entry_id: str, skill_name: str, skill_icon: str) -> None:
-        """Initialize the sensor."""
-        self._entry_id = entry_id
-        self._skill_name = skill_name
-        self._skill_icon = skill_icon
-        self._attr_name = f"{skill_name} Unlocks"
-        self._attr_unique_id = f"{entry_id}_{skill_name}_unlocks"
-        self._attr_icon = "mdi:lock-open"
-        self._state = "loaded"
-        self._unlocks_data = {}
+    The entity sets _entry_id, _skill_name, _person and _skill_slug and calls
+    _init_unlocks from its constructor.
+    """
 
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        return self._state
+    def _init_unlocks(self, unlock_store: UnlockStore) -> None:
+        """Initialize the unlock catalog from the store, which is read at setup."""
+        self._unlock_store = unlock_store
+        self._unlocks_data = unlock_store.unlocks(self._entry_id, self._skill_slug)
+        self._unlocks_revision = 0
+        self._unlock_summary: Dict[str, Dict[str, int]] = {}
+        self._unlock_summary_revision: Optional[int] = None
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra attributes."""
-        return {
-            "skill_name": self._skill_name,
-            "entry_id": self._entry_id,
-            "unlocks": json.dumps(self._unlocks_data),
-        }
-
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to hass."""
-        await super().async_added_to_hass()
-        
-        # Load unlocks data from storage
-        await self._load_unlocks_data()
-        
-        # Listen for level changes
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                f"sensor.{self._skill_name.lower().replace(' ', '_')}_level",
-                self._handle_level_change,
-            )
-        )
+    @callback
+    def _async_setup_unlocks(self) -> None:
+        """Listen for unlock management events."""
+        # Make unlocks available to the card's per-level websocket requests
+        unlock_sensors = self.hass.data.setdefault(DATA_UNLOCK_SENSORS, {})
+        unlock_sensors[self._skill_slug] = self
         
         # Listen for unlock management events
         self.async_on_remove(
@@ -267,31 +381,28 @@ class LifeSkillUnlocksSensor(SensorEntity, RestoreEntity):
             self.hass.bus.async_listen("life_skills_unlocks_imported", self._handle_unlocks_imported)
         )
 
-    async def _load_unlocks_data(self) -> None:
-        """Load unlocks data from storage."""
-        store = Store(self.hass, STORAGE_VERSION, f"{STORAGE_KEY}_{self._entry_id}_{self._skill_name.lower().replace(' ', '_')}")
-        data = await store.async_load()
-        if data:
-            self._unlocks_data = data.get("unlocks", {})
-        else:
-            self._unlocks_data = {}
+    @callback
+    def _async_remove_unlocks(self) -> None:
+        """Stop serving unlocks to the card."""
+        unlock_sensors = self.hass.data.get(DATA_UNLOCK_SENSORS, {})
+        if unlock_sensors.get(self._skill_slug) is self:
+            del unlock_sensors[self._skill_slug]
 
-    async def _save_unlocks_data(self) -> None:
+    @callback
+    def _save_unlocks_data(self) -> None:
         """Save unlocks data to storage."""
-        store = Store(self.hass, STORAGE_VERSION, f"{STORAGE_KEY}_{self._entry_id}_{self._skill_name.lower().replace(' ', '_')}")
-        await store.async_save({"unlocks": self._unlocks_data})
+        self._unlocks_revision += 1
+        self._unlock_store.async_schedule_save()
 
-    @callback
-    def _handle_level_change(self, event) -> None:
-        """Handle level changes."""
-        # For now, just trigger a state update
-        # The actual unlock filtering will be done by services/frontend
-        self.async_write_ha_state()
+    def _is_for_skill(self, event) -> bool:
+        """Check if an unlock event is for this skill, events without a person apply to everyone."""
+        person = event.data.get("person")
+        return event.data.get("skill_name") == self._skill_name and person in (None, self._person)
 
     @callback
     def _handle_unlock_added(self, event) -> None:
         """Handle unlock added event."""
-        if event.data.get("skill_name") == self._skill_name:
+        if self._is_for_skill(event):
             level = event.data.get("level")
             unlock_data = event.data.get("unlock_data")
             
@@ -300,13 +411,13 @@ class LifeSkillUnlocksSensor(SensorEntity, RestoreEntity):
                 self._unlocks_data[level_str] = []
             
             self._unlocks_data[level_str].append(unlock_data)
-            self.hass.async_create_task(self._save_unlocks_data())
+            self._save_unlocks_data()
             self.async_write_ha_state()
 
     @callback
     def _handle_unlock_removed(self, event) -> None:
         """Handle unlock removed event."""
-        if event.data.get("skill_name") == self._skill_name:
+        if self._is_for_skill(event):
             level = event.data.get("level")
             unlock_name = event.data.get("unlock_name")
             
@@ -322,30 +433,30 @@ class LifeSkillUnlocksSensor(SensorEntity, RestoreEntity):
                     if not self._unlocks_data[level_str]:
                         del self._unlocks_data[level_str]
                     
-                    self.hass.async_create_task(self._save_unlocks_data())
+                    self._save_unlocks_data()
                     self.async_write_ha_state()
 
     @callback
     def _handle_unlocks_cleared(self, event) -> None:
         """Handle unlocks cleared event."""
-        if event.data.get("skill_name") == self._skill_name:
+        if self._is_for_skill(event):
             level = event.data.get("level")
             level_str = str(level)
             
             if level_str in self._unlocks_data:
                 del self._unlocks_data[level_str]
-                self.hass.async_create_task(self._save_unlocks_data())
+                self._save_unlocks_data()
                 self.async_write_ha_state()
 
     @callback
     def _handle_unlocks_imported(self, event) -> None:
         """Handle unlocks imported event."""
-        if event.data.get("skill_name") == self._skill_name:
+        if self._is_for_skill(event):
             clear_existing = event.data.get("clear_existing", False)
             unlocks_data = event.data.get("unlocks_data", {})
             
             if clear_existing:
-                self._unlocks_data = {}
+                self._unlocks_data.clear()
             
             # Merge the imported data
             for level_str, unlocks in unlocks_data.items():
@@ -353,7 +464,7 @@ class LifeSkillUnlocksSensor(SensorEntity, RestoreEntity):
                     self._unlocks_data[level_str] = []
                 self._unlocks_data[level_str].extend(unlocks)
             
-            self.hass.async_create_task(self._save_unlocks_data())
+            self._save_unlocks_data()
             self.async_write_ha_state()
 
     async def add_unlock(self, level: int, unlock_data: Dict[str, Any]) -> None:
@@ -369,7 +480,7 @@ class LifeSkillUnlocksSensor(SensorEntity, RestoreEntity):
                 raise ValueError(f"Missing required field: {field}")
         
         self._unlocks_data[level_str].append(unlock_data)
-        await self._save_unlocks_data()
+        self._save_unlocks_data()
         self.async_write_ha_state()
 
     async def remove_unlock(self, level: int, unlock_name: str) -> bool:
@@ -389,7 +500,7 @@ class LifeSkillUnlocksSensor(SensorEntity, RestoreEntity):
             if not self._unlocks_data[level_str]:
                 del self._unlocks_data[level_str]
             
-            await self._save_unlocks_data()
+            self._save_unlocks_data()
             self.async_write_ha_state()
             return True
         
@@ -400,7 +511,7 @@ class LifeSkillUnlocksSensor(SensorEntity, RestoreEntity):
         level_str = str(level)
         if level_str in self._unlocks_data:
             del self._unlocks_data[level_str]
-            await self._save_unlocks_data()
+            self._save_unlocks_data()
             self.async_write_ha_state()
 
     def get_unlocks_for_level(self, level: int) -> list:
@@ -408,6 +519,24 @@ class LifeSkillUnlocksSensor(SensorEntity, RestoreEntity):
         level_str = str(level)
         return self._unlocks_data.get(level_str, [])
 
+    def get_unlock_summary(self) -> Dict[str, Dict[str, int]]:
+        """Get the number of unlocks per category for every level."""
+        # Every change to the unlocks bumps the revision, so the summary is
+        # only counted again when the catalog changed
+        if self._unlock_summary_revision == self._unlocks_revision:
+            return self._unlock_summary
+
+        summary = {}
+        for level_str, unlocks in self._unlocks_data.items():
+            categories = {}
+            for unlock in unlocks:
+                category = unlock.get("category") or "General"
+                categories[category] = categories.get(category, 0) + 1
+            summary[level_str] = categories
+        self._unlock_summary = summary
+        self._unlock_summary_revision = self._unlocks_revision
+        return summary
+
     def get_available_unlocks(self, current_level: int) -> Dict[str, list]:
         """Get all unlocks up to the current level."""
         available = {}
@@ -416,3 +545,143 @@ class LifeSkillUnlocksSensor(SensorEntity, RestoreEntity):
             if level_int <= current_level:
                 available[level_str] = unlocks
         return available
+
+
+class LifeSkillUnlocksSensor(SkillUnlocksMixin, SensorEntity, RestoreEntity):
+    """Sensor for skill unlocks at current level.
+
+    Only the per-level summary is in the state, the unlocks themselves are
+    fetched per level through the websocket API.
+    """
+
+    _unrecorded_attributes = frozenset({"unlocks_revision"})
+
+    def __init__(
+        self,
+        entry_id: str,
+        skill_name: str,
+        skill_icon: str,
+        unlock_store: UnlockStore,
+        person: Optional[str] = None,
+    ) -> None:
+        """Initialize the sensor."""
+        self._entry_id = entry_id
+        self._skill_name = skill_name
+        self._skill_icon = skill_icon
+        self._person = person
+        self._skill_slug = skill_slug(skill_name, person)
+        prefix = f"{person_label(person)} " if person else ""
+        unique_prefix = f"{entry_id}_{person}" if person else entry_id
+        self._attr_name = f"{prefix}{skill_name} Unlocks"
+        self._attr_unique_id = f"{unique_prefix}_{skill_name}_unlocks"
+        self._attr_icon = "mdi:lock-open"
+        self._init_unlocks(unlock_store)
+
+    @property
+    def native_value(self) -> str:
+        """Return the state of the sensor."""
+        return "loaded"
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return extra attributes."""
+        return {
+            "skill_name": self._skill_name,
+            "person": self._person,
+            "entry_id": self._entry_id,
+            "unlock_summary": self.get_unlock_summary(),
+            "unlocks_revision": self._unlocks_revision,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self._async_setup_unlocks()
+        
+        # Listen for level changes
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass,
+                f"sensor.{self._skill_slug}_level",
+                self._handle_level_change,
+            )
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """When entity will be removed from hass."""
+        self._async_remove_unlocks()
+
+    @callback
+    def _handle_level_change(self, event) -> None:
+        """Handle level changes."""
+        # For now, just trigger a state update
+        # The actual unlock filtering will be done by services/frontend
+        self.async_write_ha_state()
+
+
+class LifeSkillLeaderboardSensor(SensorEntity):
+    """Sensor ranking people by XP in one skill, or by total XP over all skills."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        leaderboard: Leaderboard,
+        unique_id: str,
+        skill_name: Optional[str] = None,
+        skill_icon: str = "mdi:trophy",
+    ) -> None:
+        """Initialize the sensor."""
+        self._leaderboard = leaderboard
+        self._skill_name = skill_name
+        self._attr_name = f"{skill_name} Leaderboard" if skill_name else "Life Skills Leaderboard"
+        self._attr_unique_id = unique_id
+        self._attr_icon = skill_icon
+
+    @property
+    def native_value(self) -> Optional[str]:
+        """Return the name of the person in first place."""
+        ranking = self._leaderboard.ranking()
+        if not ranking:
+            return None
+        return self._person_name(ranking[0][0])
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return extra attributes."""
+        ranking = []
+        for rank, (person, xp) in enumerate(self._leaderboard.ranking(), start=1):
+            entry = {"rank": rank, "person": person, "name": self._person_name(person), "xp": xp}
+            if self._skill_name:
+                entry["level"] = calculate_level_from_xp(xp)
+            ranking.append(entry)
+        return {
+            "skill_name": self._skill_name,
+            "ranking": ranking,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+
+        if self._skill_name:
+            signal = SIGNAL_LEADERBOARD_UPDATED.format(self._skill_name.lower().replace(' ', '_'))
+        else:
+            signal = SIGNAL_OVERALL_LEADERBOARD_UPDATED
+        self.async_on_remove(async_dispatcher_connect(self.hass, signal, self.async_write_ha_state))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Hand the overall leaderboard to another entry that tracks people."""
+        manager = self.hass.data[DATA_LEADERBOARDS]
+        if manager.overall_sensor is not self:
+            return
+
+        manager.overall_sensor = None
+        manager.overall_platforms.pop(self.platform.config_entry.entry_id, None)
+        if not self.hass.is_stopping:
+            async_add_overall_leaderboard(self.hass)
+
+    def _person_name(self, person: str) -> str:
+        """Return the friendly name of a person entity."""
+        state = self.hass.states.get(person)
+        return state.name if state is not None else person_label(person)
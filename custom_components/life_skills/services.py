@@ -1,13 +1,33 @@
 """Services for Life Skills integration."""
 import logging
+from datetime import timedelta
 from typing import Any, Dict
 
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.components.number import ATTR_MAX, ATTR_MIN
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, State, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 
-from .sensor import calculate_level_from_xp, calculate_xp_for_level
+from .const import (
+    CONF_PERSONS,
+    DATA_SCHEDULER,
+    DATA_SOURCES,
+    DEFAULT_CURVE_DIVISOR,
+    DEFAULT_CURVE_GROWTH,
+    DEFAULT_CURVE_MULTIPLIER,
+    DOMAIN,
+)
+from .number import async_grant_xp, async_set_xp
+from .sensor import (
+    calculate_level_from_xp,
+    calculate_levels_from_xp,
+    calculate_xp_for_level,
+    calculate_xp_thresholds,
+    person_label,
+    skill_slug,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,10 +37,16 @@ SERVICE_ADD_UNLOCK = "add_unlock"
 SERVICE_REMOVE_UNLOCK = "remove_unlock"
 SERVICE_CLEAR_UNLOCKS_FOR_LEVEL = "clear_unlocks_for_level"
 SERVICE_IMPORT_UNLOCKS = "import_unlocks"
+SERVICE_ADD_SCHEDULE = "add_schedule"
+SERVICE_REMOVE_SCHEDULE = "remove_schedule"
+SERVICE_RECALCULATE_LEVELS = "recalculate_levels"
+SERVICE_ADD_SOURCE = "add_source"
+SERVICE_REMOVE_SOURCE = "remove_source"
 
 SERVICE_ADD_XP_SCHEMA = vol.Schema(
     {
         vol.Required("name"): cv.string,
+        vol.Optional("person"): cv.entity_domain("person"),
         vol.Required("amount"): cv.positive_int,
     }
 )
@@ -28,6 +54,7 @@ SERVICE_ADD_XP_SCHEMA = vol.Schema(
 SERVICE_SET_LEVEL_SCHEMA = vol.Schema(
     {
         vol.Required("name"): cv.string,
+        vol.Optional("person"): cv.entity_domain("person"),
         vol.Required("level"): cv.positive_int,
     }
 )
@@ -35,6 +62,7 @@ SERVICE_SET_LEVEL_SCHEMA = vol.Schema(
 SERVICE_ADD_UNLOCK_SCHEMA = vol.Schema(
     {
         vol.Required("skill_name"): cv.string,
+        vol.Optional("person"): cv.entity_domain("person"),
         vol.Required("level"): cv.positive_int,
         vol.Required("unlock_name"): cv.string,
         vol.Required("category"): cv.string,
@@ -47,6 +75,7 @@ SERVICE_ADD_UNLOCK_SCHEMA = vol.Schema(
 SERVICE_REMOVE_UNLOCK_SCHEMA = vol.Schema(
     {
         vol.Required("skill_name"): cv.string,
+        vol.Optional("person"): cv.entity_domain("person"),
         vol.Required("level"): cv.positive_int,
         vol.Required("unlock_name"): cv.string,
     }
@@ -55,6 +84,7 @@ SERVICE_REMOVE_UNLOCK_SCHEMA = vol.Schema(
 SERVICE_CLEAR_UNLOCKS_FOR_LEVEL_SCHEMA = vol.Schema(
     {
         vol.Required("skill_name"): cv.string,
+        vol.Optional("person"): cv.entity_domain("person"),
         vol.Required("level"): cv.positive_int,
     }
 )
@@ -62,11 +92,87 @@ SERVICE_CLEAR_UNLOCKS_FOR_LEVEL_SCHEMA = vol.Schema(
 SERVICE_IMPORT_UNLOCKS_SCHEMA = vol.Schema(
     {
         vol.Required("skill_name"): cv.string,
+        vol.Optional("person"): cv.entity_domain("person"),
         vol.Required("unlocks_data"): dict,
         vol.Optional("clear_existing", default=False): cv.boolean,
     }
 )
 
+SERVICE_ADD_SCHEDULE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required("schedule_id"): cv.string,
+            vol.Required("skill_name"): cv.string,
+            vol.Optional("person"): cv.entity_domain("person"),
+            vol.Required("amount"): cv.positive_int,
+            vol.Exclusive("at", "recurrence"): cv.time,
+            vol.Exclusive("every", "recurrence"): vol.All(
+                cv.time_period, vol.Range(min=timedelta(seconds=1))
+            ),
+            vol.Optional("weekdays"): cv.weekdays,
+            vol.Optional("condition_entity"): cv.entity_id,
+            vol.Optional("condition_state", default="home"): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key("at", "every"),
+)
+
+SERVICE_REMOVE_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required("schedule_id"): cv.string,
+    }
+)
+
+SERVICE_ADD_SOURCE_SCHEMA = vol.Schema(
+    {
+        vol.Required("source_id"): cv.string,
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("skill_name"): cv.string,
+        vol.Optional("person"): cv.entity_domain("person"),
+        vol.Optional("amount", default=1): cv.positive_int,
+        vol.Required("per"): vol.All(vol.Coerce(float), vol.Range(min=0, min_included=False)),
+        vol.Optional("window", default={"minutes": 5}): cv.positive_time_period,
+    }
+)
+
+SERVICE_REMOVE_SOURCE_SCHEMA = vol.Schema(
+    {
+        vol.Required("source_id"): cv.string,
+    }
+)
+
+SERVICE_RECALCULATE_LEVELS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("multiplier", default=DEFAULT_CURVE_MULTIPLIER): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional("growth", default=DEFAULT_CURVE_GROWTH): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1)
+        ),
+        vol.Optional("divisor", default=DEFAULT_CURVE_DIVISOR): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1)
+        ),
+        vol.Optional("xp_scale", default=1.0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("apply", default=False): cv.boolean,
+    }
+)
+
+
+def _in_xp_range(state: State, xp: float) -> bool:
+    """Check XP against the range of a skill's number entity, as number.set_value does."""
+    return state.attributes.get(ATTR_MIN, 0) <= xp <= state.attributes.get(ATTR_MAX, xp)
+
+
+def _rebalance_xp(xp: float, level: int, curve: list, live_curve: list) -> int:
+    """Map XP on one curve to the live curve, keeping the level and progress within it."""
+    if level >= len(curve):
+        return int(live_curve[-1] + xp - curve[-1])
+
+    level_xp = curve[level - 1]
+    progress = (xp - level_xp) / max(1, curve[level] - level_xp)
+    live_level_xp = live_curve[level - 1]
+    return int(live_level_xp + progress * (live_curve[level] - live_level_xp))
+
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Life Skills."""
@@ -75,48 +181,33 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         """Add XP to a skill."""
         skill_name = call.data["name"]
         amount = call.data["amount"]
+        person = call.data.get("person")
         
-        entity_id = f"number.{skill_name.lower().replace(' ', '_')}_xp"
-        
-        # Get current XP
-        current_state = hass.states.get(entity_id)
-        if not current_state:
+        if not async_grant_xp(hass, skill_name, amount, person):
             _LOGGER.error("Skill %s not found", skill_name)
             return
-        
-        try:
-            current_xp = int(float(current_state.state))
-            new_xp = current_xp + amount
-            
-            # Update the number entity
-            await hass.services.async_call(
-                "number",
-                "set_value",
-                {"entity_id": entity_id, "value": new_xp},
-                blocking=True,
-            )
-            
-            _LOGGER.info("Added %d XP to %s (now at %d XP)", amount, skill_name, new_xp)
-        except (ValueError, TypeError) as err:
-            _LOGGER.error("Error adding XP to %s: %s", skill_name, err)
+
+        new_state = hass.states.get(f"number.{skill_slug(skill_name, person)}_xp")
+        _LOGGER.info("Added %d XP to %s (now at %s XP)", amount, skill_name, new_state.state)
 
     async def set_level_service(call: ServiceCall) -> None:
         """Set a skill to a specific level."""
         skill_name = call.data["name"]
         target_level = call.data["level"]
         
-        entity_id = f"number.{skill_name.lower().replace(' ', '_')}_xp"
-        
         # Calculate XP needed for target level
         required_xp = calculate_xp_for_level(target_level)
-        
+
+        entity_id = f"number.{skill_slug(skill_name, call.data.get('person'))}_xp"
+        if (state := hass.states.get(entity_id)) is not None and not _in_xp_range(state, required_xp):
+            raise ServiceValidationError(
+                f"Level {target_level} needs {required_xp} XP, which is outside the range of {entity_id}"
+            )
+
         # Update the number entity
-        await hass.services.async_call(
-            "number",
-            "set_value",
-            {"entity_id": entity_id, "value": required_xp},
-            blocking=True,
-        )
+        if not async_set_xp(hass, skill_name, required_xp, call.data.get("person")):
+            _LOGGER.error("Skill %s not found", skill_name)
+            return
         
         _LOGGER.info("Set %s to level %d (%d XP)", skill_name, target_level, required_xp)
 
@@ -141,6 +232,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         # Trigger an update event
         hass.bus.async_fire("life_skills_unlock_added", {
             "skill_name": skill_name,
+            "person": call.data.get("person"),
             "level": level,
             "unlock_data": unlock_data
         })
@@ -156,6 +248,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         # Trigger a removal event
         hass.bus.async_fire("life_skills_unlock_removed", {
             "skill_name": skill_name,
+            "person": call.data.get("person"),
             "level": level,
             "unlock_name": unlock_name
         })
@@ -170,6 +263,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         # Trigger a clear event
         hass.bus.async_fire("life_skills_unlocks_cleared", {
             "skill_name": skill_name,
+            "person": call.data.get("person"),
             "level": level
         })
         
@@ -216,6 +310,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         # Trigger an import event
         hass.bus.async_fire("life_skills_unlocks_imported", {
             "skill_name": skill_name,
+            "person": call.data.get("person"),
             "unlocks_data": validated_data,
             "clear_existing": clear_existing
         })
@@ -223,6 +318,134 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         _LOGGER.info("Imported %d unlocks for %s (%d errors)", 
                    import_count, skill_name, error_count)
 
+    async def add_schedule_service(call: ServiceCall) -> None:
+        """Add or replace a recurring XP grant."""
+        schedule = {
+            "schedule_id": call.data["schedule_id"],
+            "skill_name": call.data["skill_name"],
+            "amount": call.data["amount"],
+        }
+        if "person" in call.data:
+            schedule["person"] = call.data["person"]
+        if "at" in call.data:
+            schedule["at"] = call.data["at"].isoformat()
+            schedule["weekdays"] = call.data.get("weekdays")
+        else:
+            schedule["every"] = call.data["every"].total_seconds()
+        if "condition_entity" in call.data:
+            schedule["condition_entity"] = call.data["condition_entity"]
+            schedule["condition_state"] = call.data["condition_state"]
+
+        due = await hass.data[DATA_SCHEDULER].async_add_schedule(schedule)
+
+        _LOGGER.info("Scheduled %d XP for %s as '%s', next due %s",
+                   schedule["amount"], schedule["skill_name"], schedule["schedule_id"], due)
+
+    async def remove_schedule_service(call: ServiceCall) -> None:
+        """Remove a recurring XP grant."""
+        schedule_id = call.data["schedule_id"]
+
+        if await hass.data[DATA_SCHEDULER].async_remove_schedule(schedule_id):
+            _LOGGER.info("Removed schedule '%s'", schedule_id)
+        else:
+            _LOGGER.error("Schedule %s not found", schedule_id)
+
+    async def add_source_service(call: ServiceCall) -> None:
+        """Bind a sensor to a skill, converting its increases to XP."""
+        source = {
+            "source_id": call.data["source_id"],
+            "entity_id": call.data["entity_id"],
+            "skill_name": call.data["skill_name"],
+            "amount": call.data["amount"],
+            "per": call.data["per"],
+            "window": call.data["window"].total_seconds(),
+        }
+        if "person" in call.data:
+            source["person"] = call.data["person"]
+
+        await hass.data[DATA_SOURCES].async_add_source(source)
+
+        _LOGGER.info("Bound %s to %s as '%s', %d XP per %s",
+                   source["entity_id"], source["skill_name"], source["source_id"],
+                   source["amount"], source["per"])
+
+    async def remove_source_service(call: ServiceCall) -> None:
+        """Unbind a sensor from its skill."""
+        source_id = call.data["source_id"]
+
+        if await hass.data[DATA_SOURCES].async_remove_source(source_id):
+            _LOGGER.info("Removed source '%s'", source_id)
+        else:
+            _LOGGER.error("Source %s not found", source_id)
+
+    async def recalculate_levels_service(call: ServiceCall) -> ServiceResponse:
+        """Preview, and optionally apply, the levels of every skill under a new XP curve."""
+        names = []
+        states = []
+        xp_values = []
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            for skill in entry.data.get("skills", []):
+                skill_name = skill.get("name", "Unknown")
+                for person in skill.get(CONF_PERSONS) or [None]:
+                    state = hass.states.get(f"number.{skill_slug(skill_name, person)}_xp")
+                    if state is None:
+                        continue
+                    try:
+                        xp_values.append(float(state.state))
+                    except (ValueError, TypeError):
+                        continue
+                    names.append((skill_name, person))
+                    states.append(state)
+
+        # Thresholds are computed once per curve and shared by every skill
+        live_curve = calculate_xp_thresholds()
+        try:
+            curve = calculate_xp_thresholds(
+                multiplier=call.data["multiplier"],
+                growth=call.data["growth"],
+                divisor=call.data["divisor"],
+            )
+        except ValueError as err:
+            # A small growth doubles the curve too often to stay finite up to MAX_LEVEL
+            raise ServiceValidationError(str(err)) from err
+        projected_xp = [xp * call.data["xp_scale"] for xp in xp_values]
+        levels = calculate_levels_from_xp(xp_values, live_curve)
+        new_levels = calculate_levels_from_xp(projected_xp, curve)
+
+        preview = {}
+        skills = {}
+        out_of_range = []
+        for (skill_name, person), state, xp, level, scaled_xp, new_level in zip(
+            names, states, xp_values, levels, projected_xp, new_levels
+        ):
+            # Per-person skills are reported under the same name as their entities
+            key = f"{person_label(person)} {skill_name}" if person else skill_name
+            skills[key] = (skill_name, person)
+            new_xp = _rebalance_xp(scaled_xp, new_level, curve, live_curve)
+            preview[key] = {
+                "person": person,
+                "xp": xp,
+                "level": level,
+                "new_level": new_level,
+                "new_xp": new_xp,
+            }
+            if not _in_xp_range(state, new_xp):
+                out_of_range.append(key)
+
+        if call.data["apply"]:
+            # Skills whose new XP doesn't fit their number entity keep their XP
+            for key, result in preview.items():
+                if result["new_xp"] != result["xp"] and key not in out_of_range:
+                    skill_name, person = skills[key]
+                    async_set_xp(hass, skill_name, result["new_xp"], person)
+            if out_of_range:
+                _LOGGER.warning("Not applied to %s, the new XP is out of range", ", ".join(out_of_range))
+
+        _LOGGER.info("Recalculated levels for %d skills%s",
+                   len(preview), " and applied them" if call.data["apply"] else "")
+
+        return {"skills": preview, "out_of_range": out_of_range}
+
     hass.services.async_register(
         "life_skills", SERVICE_ADD_XP, add_xp_service, schema=SERVICE_ADD_XP_SCHEMA
     )
@@ -246,6 +469,30 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     hass.services.async_register(
         "life_skills", SERVICE_IMPORT_UNLOCKS, import_unlocks_service, schema=SERVICE_IMPORT_UNLOCKS_SCHEMA
     )
+    
+    hass.services.async_register(
+        "life_skills", SERVICE_ADD_SCHEDULE, add_schedule_service, schema=SERVICE_ADD_SCHEDULE_SCHEMA
+    )
+    
+    hass.services.async_register(
+        "life_skills", SERVICE_REMOVE_SCHEDULE, remove_schedule_service, schema=SERVICE_REMOVE_SCHEDULE_SCHEMA
+    )
+    
+    hass.services.async_register(
+        "life_skills", SERVICE_ADD_SOURCE, add_source_service, schema=SERVICE_ADD_SOURCE_SCHEMA
+    )
+    
+    hass.services.async_register(
+        "life_skills", SERVICE_REMOVE_SOURCE, remove_source_service, schema=SERVICE_REMOVE_SOURCE_SCHEMA
+    )
+    
+    hass.services.async_register(
+        "life_skills",
+        SERVICE_RECALCULATE_LEVELS,
+        recalculate_levels_service,
+        schema=SERVICE_RECALCULATE_LEVELS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
@@ -256,3 +503,8 @@ async def async_unload_services(hass: HomeAssistant) -> None:
     hass.services.async_remove("life_skills", SERVICE_REMOVE_UNLOCK)
     hass.services.async_remove("life_skills", SERVICE_CLEAR_UNLOCKS_FOR_LEVEL)
     hass.services.async_remove("life_skills", SERVICE_IMPORT_UNLOCKS)
+    hass.services.async_remove("life_skills", SERVICE_ADD_SCHEDULE)
+    hass.services.async_remove("life_skills", SERVICE_REMOVE_SCHEDULE)
+    hass.services.async_remove("life_skills", SERVICE_RECALCULATE_LEVELS)
+    hass.services.async_remove("life_skills", SERVICE_ADD_SOURCE)
+    hass.services.async_remove("life_skills", SERVICE_REMOVE_SOURCE)
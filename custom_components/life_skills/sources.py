@@ -0,0 +1,186 @@
+"""Sensor-bound XP sources for Life Skills integration."""
+import logging
+import math
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.helpers.storage import Store
+
+from .number import async_grant_xp
+
+_LOGGER = logging.getLogger(__name__)
+STORAGE_VERSION = 1
+STORAGE_KEY = "life_skills_sources"
+SAVE_DELAY = 10
+
+
+def calculate_source_delta(last_value: Optional[float], value: float) -> float:
+    """Calculate how much a counter increased, treating a drop as a reset to zero."""
+    if last_value is None:
+        return 0
+    if value < last_value:
+        return value
+    return value - last_value
+
+
+def calculate_source_xp(units: float, amount: int, per: float) -> int:
+    """Calculate the whole XP earned for a number of units at amount XP per units."""
+    # The small tolerance keeps 0.1 + 0.2 style sums from losing an XP
+    return math.floor(units * amount / per + 1e-9)
+
+
+class XpSourceManager:
+    """Turn changes of bound sensors into XP, one grant per source and window.
+
+    State changes only add to the units pending for a source. The first change
+    in a window arms a timer and the grant is made when it fires, so a sensor
+    that updates every few seconds still results in a single grant per window.
+    Units that don't add up to a whole XP are carried over to the next window.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manager."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        self._entities: Dict[str, List[str]] = {}
+        self._values: Dict[str, float] = {}
+        self._pending: Dict[str, float] = {}
+        self._timers: Dict[str, CALLBACK_TYPE] = {}
+        self._unsub_state: Optional[CALLBACK_TYPE] = None
+
+    @property
+    def sources(self) -> Dict[str, Dict[str, Any]]:
+        """Return all sources keyed by source id."""
+        return self._sources
+
+    async def async_load(self) -> None:
+        """Load sources from storage and start listening to their sensors."""
+        data = await self._store.async_load()
+        for source in (data or {}).get("sources", []):
+            self._sources[source["source_id"]] = source
+        self._subscribe()
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to store."""
+        return {"sources": list(self._sources.values())}
+
+    async def async_add_source(self, source: Dict[str, Any]) -> None:
+        """Add or replace a source, counting from the sensor's current value."""
+        source_id = source["source_id"]
+        self._cancel(source_id)
+
+        # Whatever the sensor counted before it was bound doesn't earn XP
+        source["last_value"] = self._parse(self.hass.states.get(source["entity_id"]))
+        source["remainder"] = 0
+        self._sources[source_id] = source
+        self._subscribe()
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove_source(self, source_id: str) -> bool:
+        """Remove a source, return False if it doesn't exist."""
+        if self._sources.pop(source_id, None) is None:
+            return False
+
+        self._cancel(source_id)
+        self._subscribe()
+        await self._store.async_save(self._data_to_save())
+        return True
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening and cancel pending windows, called when Home Assistant stops.
+
+        Units of an open window aren't lost, the stored last value still
+        predates them and they are counted again on the next state change.
+        """
+        if self._unsub_state is not None:
+            self._unsub_state()
+            self._unsub_state = None
+        for source_id in list(self._timers):
+            self._cancel(source_id)
+
+    @callback
+    def _cancel(self, source_id: str) -> None:
+        """Drop the open window of a source."""
+        if (unsub := self._timers.pop(source_id, None)) is not None:
+            unsub()
+        self._pending.pop(source_id, None)
+        self._values.pop(source_id, None)
+
+    @callback
+    def _subscribe(self) -> None:
+        """Listen to the state changes of every bound sensor with one subscription."""
+        if self._unsub_state is not None:
+            self._unsub_state()
+            self._unsub_state = None
+
+        self._entities = {}
+        for source_id, source in self._sources.items():
+            self._entities.setdefault(source["entity_id"], []).append(source_id)
+        if self._entities:
+            self._unsub_state = async_track_state_change_event(
+                self.hass, list(self._entities), self._handle_state_change
+            )
+
+    @staticmethod
+    def _parse(state) -> Optional[float]:
+        """Return the numeric value of a state, or None if it has none."""
+        if state is None:
+            return None
+        try:
+            return float(state.state)
+        except (ValueError, TypeError):
+            return None
+
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        """Add the increase of a sensor to the open window of its sources."""
+        value = self._parse(event.data.get("new_state"))
+        if value is None:
+            return
+
+        for source_id in self._entities.get(event.data["entity_id"], []):
+            source = self._sources[source_id]
+            last_value = self._values.get(source_id, source.get("last_value"))
+            self._values[source_id] = value
+            if last_value is None:
+                # First value seen, there is nothing to compare it to yet
+                source["last_value"] = value
+                self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+                continue
+
+            delta = calculate_source_delta(last_value, value)
+            if delta <= 0:
+                continue
+
+            self._pending[source_id] = self._pending.get(source_id, 0) + delta
+            if source_id not in self._timers:
+                self._timers[source_id] = async_call_later(
+                    self.hass, source["window"], partial(self._async_flush, source_id)
+                )
+
+    @callback
+    def _async_flush(self, source_id: str, now: datetime) -> None:
+        """Close the window of a source and grant the XP it earned."""
+        self._timers.pop(source_id, None)
+        source = self._sources.get(source_id)
+        if source is None:
+            return
+
+        units = self._pending.pop(source_id, 0) + source.get("remainder", 0)
+        xp = calculate_source_xp(units, source["amount"], source["per"])
+        source["remainder"] = max(0, units - xp * source["per"] / source["amount"])
+        source["last_value"] = self._values.get(source_id, source.get("last_value"))
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+        if xp <= 0:
+            return
+        if async_grant_xp(self.hass, source["skill_name"], xp, source.get("person")):
+            _LOGGER.debug("Source %s granted %d XP to %s", source_id, xp, source["skill_name"])
+        else:
+            _LOGGER.warning("Source %s skipped, skill %s not found", source_id, source["skill_name"])
@@ -0,0 +1,84 @@
+"""Unlock storage for Life Skills integration."""
+import logging
+from typing import Any, Dict, List
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+STORAGE_VERSION = 1
+STORAGE_KEY = "life_skills_unlocks"
+SAVE_DELAY = 5
+
+
+class UnlockStore:
+    """Unlock catalogs of every skill, kept in a single file.
+
+    The file is read once when the integration is set up, instead of once per
+    skill. Changes are written back with a short delay so a burst of service
+    calls results in one write.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._entries: Dict[str, Dict[str, Dict[str, list]]] = {}
+
+    async def async_load(self, skill_slugs: Dict[str, List[str]]) -> None:
+        """Read the file, migrating the files of older versions on first use.
+
+        skill_slugs holds the slugs of the skills of every config entry, older
+        versions kept a file per entry or per skill named after them.
+        """
+        data = await self._store.async_load()
+        if data is not None:
+            self._entries = data.get("entries", {})
+            return
+
+        legacy_stores = []
+        for entry_id, slugs in skill_slugs.items():
+            legacy = Store(self.hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry_id}")
+            if (legacy_data := await legacy.async_load()) is not None:
+                self._entries[entry_id] = legacy_data.get("skills", {})
+                legacy_stores.append(legacy)
+
+            for skill_slug in slugs:
+                legacy = Store(self.hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry_id}_{skill_slug}")
+                if (legacy_data := await legacy.async_load()) is None:
+                    continue
+                self._entries.setdefault(entry_id, {})[skill_slug] = legacy_data.get("unlocks", {})
+                legacy_stores.append(legacy)
+
+        if not legacy_stores:
+            return
+
+        # The old files are only removed once the merged file has been written
+        await self._store.async_save(self._data_to_save())
+        for legacy in legacy_stores:
+            await legacy.async_remove()
+        _LOGGER.debug("Migrated %d unlock files to one file", len(legacy_stores))
+
+    def unlocks(self, entry_id: str, skill_slug: str) -> Dict[str, list]:
+        """Return the unlocks of a skill by level, the dict is changed in place."""
+        return self._entries.setdefault(entry_id, {}).setdefault(skill_slug, {})
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Write the unlocks to storage after a short delay."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Drop the unlocks of a deleted config entry."""
+        if self._entries.pop(entry_id, None) is not None:
+            self.async_schedule_save()
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to store."""
+        entries = {}
+        for entry_id, skills in self._entries.items():
+            if skills := {slug: unlocks for slug, unlocks in skills.items() if unlocks}:
+                entries[entry_id] = skills
+        return {"entries": entries}
@@ -0,0 +1,41 @@
+"""Websocket API for Life Skills integration."""
+from typing import Any, Dict
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_UNLOCK_SENSORS
+from .sensor import skill_slug
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_get_unlocks)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "life_skills/unlocks",
+        vol.Required("skill_name"): str,
+        vol.Optional("person"): str,
+        vol.Required("levels"): [vol.Coerce(int)],
+    }
+)
+@callback
+def websocket_get_unlocks(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]
+) -> None:
+    """Return the unlocks of a skill for the requested levels."""
+    skill_name = msg["skill_name"]
+    sensor = hass.data.get(DATA_UNLOCK_SENSORS, {}).get(skill_slug(skill_name, msg.get("person")))
+    if sensor is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, f"Skill {skill_name} not found")
+        return
+
+    connection.send_result(
+        msg["id"],
+        {"unlocks": {str(level): sensor.get_unlocks_for_level(level) for level in msg["levels"]}},
+    )
@@ -1,3 +1,13 @@
+// Level of a skill from its level sensor, or from the level attribute of a
+// compact skill's XP number
+function skillLevel(entity) {
+  if (!entity) {
+    return 1;
+  }
+  const level = entity.attributes && entity.attributes.level !== undefined ? entity.attributes.level : entity.state;
+  return parseInt(level) || 1;
+}
+
 class LifeSkillsCard extends HTMLElement {
   constructor() {
     super();
@@ -20,12 +30,33 @@ class LifeSkillsCard extends HTMLElement {
     }
     
     this.config = config;
+    this._rendered = null;
     this.render();
   }
 
   set hass(hass) {
     this._hass = hass;
     this.render();
+
+    // Keep an open unlocks dialog in sync with the backend
+    if (this._unlockList) {
+      const { unlocksEntity, levelEntity } = this._skillEntities();
+      this._unlockList.update(hass, unlocksEntity, levelEntity);
+    }
+  }
+
+  // A compact skill has no level and unlocks sensors, its XP number carries both
+  _skillEntities() {
+    const selectedSkill = this.config.skill || '';
+    const xpEntity = selectedSkill && this._hass.states ? this._hass.states[selectedSkill] : undefined;
+    if (xpEntity && xpEntity.attributes && xpEntity.attributes.level !== undefined) {
+      return { xpEntity, levelEntity: xpEntity, unlocksEntity: xpEntity };
+    }
+    return {
+      xpEntity,
+      levelEntity: this._hass.states[selectedSkill.replace('number.', 'sensor.').replace('_xp', '_level')],
+      unlocksEntity: this._hass.states[selectedSkill.replace('number.', 'sensor.').replace('_xp', '_unlocks')],
+    };
   }
 
   render() {
@@ -33,64 +64,55 @@ class LifeSkillsCard extends HTMLElement {
       return;
     }
 
-    const selectedSkill = this.config.skill || '';
-    let skillContent = '<div style="padding: 16px; text-align: center; color: var(--secondary-text-color);">No skill selected. Use the visual editor to choose a skill.</div>';
-    
-    if (selectedSkill && this._hass.states && this._hass.states[selectedSkill]) {
-      const xpEntity = this._hass.states[selectedSkill];
-      const xp = parseInt(xpEntity.state) || 0;
-      
-      // Get corresponding level entity
-      const levelEntityId = selectedSkill.replace('number.', 'sensor.').replace('_xp', '_level');
-      const levelEntity = this._hass.states[levelEntityId];
-      const level = levelEntity ? parseInt(levelEntity.state) || 1 : 1;
-      
-      // Get XP to next level entity
-      const xpToNextEntityId = selectedSkill.replace('number.', 'sensor.').replace('_xp', '_xp_to_next');
-      const xpToNextEntity = this._hass.states[xpToNextEntityId];
-      const xpToNext = xpToNextEntity ? parseInt(xpToNextEntity.state) || 0 : 0;
-      
-      // Get unlocks entity
-      const unlocksEntityId = selectedSkill.replace('number.', 'sensor.').replace('_xp', '_unlocks');
-      const unlocksEntity = this._hass.states[unlocksEntityId];
-      
-      let skillName = xpEntity.attributes && xpEntity.attributes.friendly_name ? xpEntity.attributes.friendly_name : 'Unknown Skill';
-      
-      // Remove " XP" suffix if it exists for the display name
-      if (skillName.endsWith(' XP')) {
-        skillName = skillName.slice(0, -3);
-      }
-      
-      // Calculate progress percentage to next level
-      const currentLevelXp = this._calculateXpForLevel(level);
-      const nextLevelXp = this._calculateXpForLevel(level + 1);
-      const xpInCurrentLevel = xp - currentLevelXp;
-      const xpNeededForLevel = nextLevelXp - currentLevelXp;
-      const progressPercent = xpNeededForLevel > 0 ? Math.round((xpInCurrentLevel / xpNeededForLevel) * 100) : 100;
-      
-      // Get skill icon from the XP entity
-      const skillIcon = xpEntity.attributes && xpEntity.attributes.icon ? xpEntity.attributes.icon : 'mdi:star';
-      
-      skillContent = `
-        <div class="skill-card-container" @click="${this._showUnlocksPopup.bind(this)}">
-          <div class="top-row">
-            <div class="icon-section">
-              <ha-icon icon="${skillIcon}"></ha-icon>
-            </div>
-            <div class="level-info">
-              <div class="current-level">${level}</div>
-              <div class="max-level">99</div>
-            </div>
-          </div>
-          <div class="name-section">
-            <span class="skill-name">${skillName}</span>
-          </div>
-        </div>
-        <div class="progress-bar">
-          <div class="progress-fill" style="width: ${progressPercent}%"></div>
-          <div class="progress-empty" style="width: ${100 - progressPercent}%"></div>
-        </div>
-      `;
+    // Get the XP entity and its corresponding level entity
+    const { xpEntity, levelEntity } = this._skillEntities();
+    
+    // Home Assistant replaces state objects when they change, so the card
+    // only needs patching when one of its own entities has a new object
+    if (this._rendered && this._rendered.xpEntity === xpEntity && this._rendered.levelEntity === levelEntity) {
+      return;
+    }
+    this._rendered = { xpEntity, levelEntity };
+    this._ensureCardElements();
+    
+    const elements = this._cardElements;
+    elements.placeholder.hidden = Boolean(xpEntity);
+    elements.skill.hidden = !xpEntity;
+    if (!xpEntity) {
+      return;
+    }
+    
+    const xp = parseInt(xpEntity.state) || 0;
+    const level = skillLevel(levelEntity);
+    
+    let skillName = xpEntity.attributes && xpEntity.attributes.friendly_name ? xpEntity.attributes.friendly_name : 'Unknown Skill';
+    
+    // Remove " XP" suffix if it exists for the display name
+    if (skillName.endsWith(' XP')) {
+      skillName = skillName.slice(0, -3);
+    }
+    
+    // Calculate progress percentage to next level
+    const currentLevelXp = this._calculateXpForLevel(level);
+    const nextLevelXp = this._calculateXpForLevel(level + 1);
+    const xpInCurrentLevel = xp - currentLevelXp;
+    const xpNeededForLevel = nextLevelXp - currentLevelXp;
+    const progressPercent = xpNeededForLevel > 0 ? Math.round((xpInCurrentLevel / xpNeededForLevel) * 100) : 100;
+    
+    // Get skill icon from the XP entity
+    const skillIcon = xpEntity.attributes && xpEntity.attributes.icon ? xpEntity.attributes.icon : 'mdi:star';
+    
+    elements.icon.setAttribute('icon', skillIcon);
+    elements.level.textContent = level;
+    elements.name.textContent = skillName;
+    elements.progressFill.style.width = `${progressPercent}%`;
+    elements.progressEmpty.style.width = `${100 - progressPercent}%`;
+  }
+
+  // Build the card's DOM once; later updates only patch the changing values
+  _ensureCardElements() {
+    if (this._cardElements) {
+      return;
     }
     
     // Use shadowRoot for proper encapsulation, important for mobile
@@ -220,21 +242,42 @@ class LifeSkillsCard extends HTMLElement {
         }
       </style>
       <ha-card>
-        ${skillContent}
+        <div class="placeholder" style="padding: 16px; text-align: center; color: var(--secondary-text-color);">No skill selected. Use the visual editor to choose a skill.</div>
+        <div class="skill-content" hidden>
+          <div class="skill-card-container">
+            <div class="top-row">
+              <div class="icon-section">
+                <ha-icon icon="mdi:star"></ha-icon>
+              </div>
+              <div class="level-info">
+                <div class="current-level"></div>
+                <div class="max-level">99</div>
+              </div>
+            </div>
+            <div class="name-section">
+              <span class="skill-name"></span>
+            </div>
+          </div>
+          <div class="progress-bar">
+            <div class="progress-fill"></div>
+            <div class="progress-empty"></div>
+          </div>
+        </div>
       </ha-card>
     `;
-
-    // Add click event listener to the card after a micro task to ensure DOM is ready
-    requestAnimationFrame(() => {
-      const card = this.shadowRoot.querySelector('ha-card');
-      if (card) {
-        // Remove any existing listeners first
-        card.removeEventListener('click', this._cardClickHandler);
-        // Add the new listener
-        this._cardClickHandler = () => this._showUnlocksPopup();
-        card.addEventListener('click', this._cardClickHandler);
-      }
-    });
+    
+    const root = this.shadowRoot;
+    this._cardElements = {
+      placeholder: root.querySelector('.placeholder'),
+      skill: root.querySelector('.skill-content'),
+      icon: root.querySelector('.icon-section ha-icon'),
+      level: root.querySelector('.current-level'),
+      name: root.querySelector('.skill-name'),
+      progressFill: root.querySelector('.progress-fill'),
+      progressEmpty: root.querySelector('.progress-empty'),
+    };
+    
+    root.querySelector('ha-card').addEventListener('click', () => this._showUnlocksPopup());
   }
 
   // Helper method to calculate XP for a given level (reusing the logic from sensor.py)
@@ -257,16 +300,8 @@ class LifeSkillsCard extends HTMLElement {
       return;
     }
 
-    const selectedSkill = this.config.skill;
-    const xpEntity = this._hass.states[selectedSkill];
-    
     // Get corresponding entities
-    const levelEntityId = selectedSkill.replace('number.', 'sensor.').replace('_xp', '_level');
-    const levelEntity = this._hass.states[levelEntityId];
-    const currentLevel = levelEntity ? parseInt(levelEntity.state) || 1 : 1;
-    
-    const unlocksEntityId = selectedSkill.replace('number.', 'sensor.').replace('_xp', '_unlocks');
-    const unlocksEntity = this._hass.states[unlocksEntityId];
+    const { xpEntity, levelEntity, unlocksEntity } = this._skillEntities();
     
     let skillName = xpEntity.attributes && xpEntity.attributes.friendly_name ? xpEntity.attributes.friendly_name : 'Unknown Skill';
     if (skillName.endsWith(' XP')) {
@@ -275,50 +310,29 @@ class LifeSkillsCard extends HTMLElement {
 
     const skillIcon = xpEntity.attributes && xpEntity.attributes.icon ? xpEntity.attributes.icon : 'mdi:star';
 
-    // Parse unlocks data
-    let unlocksData = {};
-    if (unlocksEntity && unlocksEntity.attributes && unlocksEntity.attributes.unlocks) {
-      try {
-        unlocksData = JSON.parse(unlocksEntity.attributes.unlocks);
-      } catch (e) {
-        console.error('Failed to parse unlocks data:', e);
-      }
-    }
-
-    // Use Home Assistant's dialog system
-    this._openDialog(skillName, skillIcon, currentLevel, unlocksData);
-  }
-
-  _openDialog(skillName, skillIcon, currentLevel, unlocksData) {
-    // Use Home Assistant's dialog system properly
-    const dialogConfig = {
-      title: `${skillName} Unlocks`,
-      content: this._createDialogContent(skillName, skillIcon, currentLevel, unlocksData),
-      wide: true,
-      hideActions: true
+    // Only the per-level summary is needed up front, unlocks are fetched per level
+    const dialogData = {
+      skillName,
+      skillIcon,
+      skillKey: xpEntity.attributes && xpEntity.attributes.skill_name ? xpEntity.attributes.skill_name : skillName,
+      person: xpEntity.attributes && xpEntity.attributes.person ? xpEntity.attributes.person : null,
+      unlocksEntity,
+      levelEntity,
     };
 
-    // Fire show-dialog event that HA's dialog manager will handle
-    const event = new CustomEvent('show-dialog', {
-      detail: {
-        dialogTag: 'ha-dialog',
-        dialogImport: () => import('../../../../../../src/dialogs/ha-dialog'),
-        dialogParams: dialogConfig
-      },
-      bubbles: true,
-      composed: true
-    });
+    // The dialog is our own overlay, so the virtual unlock list can be attached to it
+    this._openDialog(dialogData);
+  }
 
-    this.dispatchEvent(event);
-    
-    // Fallback: Create our own dialog if HA's system isn't available
-    if (!event.defaultPrevented) {
-      this._createFallbackDialog(skillName, skillIcon, currentLevel, unlocksData);
+  _unlockSummary(unlocksEntity) {
+    if (unlocksEntity && unlocksEntity.attributes && unlocksEntity.attributes.unlock_summary) {
+      return unlocksEntity.attributes.unlock_summary;
     }
+    return {};
   }
 
-  _createFallbackDialog(skillName, skillIcon, currentLevel, unlocksData) {
-    // Create a modal overlay as fallback
+  _openDialog(dialogData) {
+    // Create a modal overlay
     const overlay = document.createElement('div');
     overlay.style.cssText = `
       position: fixed;
@@ -366,19 +380,38 @@ class LifeSkillsCard extends HTMLElement {
       justify-content: center;
     `;
     
-    closeBtn.addEventListener('click', () => {
+    const unlockSummary = this._unlockSummary(dialogData.unlocksEntity);
+    dialog.innerHTML = this._createDialogContent(dialogData.skillName, dialogData.skillIcon, unlockSummary);
+    dialog.appendChild(closeBtn);
+    
+    // Only the rows in view are rendered, levels are loaded as they are expanded
+    const container = dialog.querySelector('.unlocks-container');
+    const unlockList = Object.keys(unlockSummary).length > 0
+      ? new LifeSkillsUnlockList(container, {
+          hass: this._hass,
+          skillName: dialogData.skillKey,
+          person: dialogData.person,
+          unlocksEntity: dialogData.unlocksEntity,
+          levelEntity: dialogData.levelEntity,
+          renderUnlock: (level, unlock, levelReached) => this._createUnlockCard(level, unlock, levelReached && this._additionalRequirementsMet(unlock.additional_reqs)),
+        })
+      : null;
+    this._unlockList = unlockList;
+    
+    const closeDialog = () => {
       if (overlay.parentNode) {
         overlay.parentNode.removeChild(overlay);
       }
-    });
+      if (this._unlockList === unlockList) {
+        this._unlockList = null;
+      }
+      document.removeEventListener('keydown', escapeHandler);
+    };
     
-    dialog.innerHTML = this._createDialogContent(skillName, skillIcon, currentLevel, unlocksData);
-    dialog.appendChild(closeBtn);
+    closeBtn.addEventListener('click', closeDialog);
     
     // Add filter chip functionality
     const filterChips = dialog.querySelectorAll('.filter-chip');
-    const unlockCards = dialog.querySelectorAll('.unlock-card');
-    const levelSections = dialog.querySelectorAll('.level-section');
     
     filterChips.forEach(chip => {
       chip.addEventListener('click', () => {
@@ -387,27 +420,10 @@ class LifeSkillsCard extends HTMLElement {
         // Add active class to clicked chip
         chip.classList.add('active');
         
-        const selectedCategory = chip.getAttribute('data-category');
-        
-        // Show/hide unlock cards based on category
-        unlockCards.forEach(card => {
-          const cardCategory = card.getAttribute('data-category');
-          if (selectedCategory === 'all' || cardCategory === selectedCategory) {
-            card.style.display = 'flex';
-          } else {
-            card.style.display = 'none';
-          }
-        });
-        
-        // Show/hide level sections if they have visible cards
-        levelSections.forEach(section => {
-          const visibleCards = section.querySelectorAll('.unlock-card:not([style*="display: none"])');
-          if (visibleCards.length > 0) {
-            section.style.display = 'block';
-          } else {
-            section.style.display = 'none';
-          }
-        });
+        // Levels without unlocks in the category are left out of the list
+        if (unlockList) {
+          unlockList.setCategory(chip.getAttribute('data-category'));
+        }
       });
     });
     
@@ -416,17 +432,14 @@ class LifeSkillsCard extends HTMLElement {
     // Close on overlay click
     overlay.addEventListener('click', (e) => {
       if (e.target === overlay) {
-        overlay.parentNode.removeChild(overlay);
+        closeDialog();
       }
     });
     
     // Close on escape key
     const escapeHandler = (e) => {
       if (e.key === 'Escape') {
-        if (overlay.parentNode) {
-          overlay.parentNode.removeChild(overlay);
-        }
-        document.removeEventListener('keydown', escapeHandler);
+        closeDialog();
       }
     };
     document.addEventListener('keydown', escapeHandler);
@@ -434,17 +447,13 @@ class LifeSkillsCard extends HTMLElement {
     document.body.appendChild(overlay);
   }
 
-  _createDialogContent(skillName, skillIcon, currentLevel, unlocksData) {
-    const levels = Object.keys(unlocksData).map(l => parseInt(l)).sort((a, b) => a - b);
+  _createDialogContent(skillName, skillIcon, unlockSummary) {
+    const levels = Object.keys(unlockSummary);
     
     // Get all unique categories for filter chips
     const allCategories = new Set();
     levels.forEach(level => {
-      const unlocks = unlocksData[level.toString()] || [];
-      unlocks.forEach(unlock => {
-        const category = unlock.category || 'General';
-        allCategories.add(category);
-      });
+      Object.keys(unlockSummary[level] || {}).forEach(category => allCategories.add(category));
     });
     const categories = Array.from(allCategories).sort();
     
@@ -458,27 +467,10 @@ class LifeSkillsCard extends HTMLElement {
       </div>
     `;
     
-    let unlocksHtml = '';
-    if (levels.length === 0) {
-      unlocksHtml = '<div class="no-unlocks">No unlocks defined for this skill yet.</div>';
-    } else {
-      for (const level of levels) {
-        const unlocks = unlocksData[level.toString()] || [];
-        const levelReached = level <= currentLevel;
-        
-        unlocksHtml += `
-          <div class="level-section">
-            <div class="level-header">
-              <div class="level-number ${levelReached ? 'unlocked' : 'locked'}">Level ${level}</div>
-              <span>${levelReached ? 'Unlocked' : 'Locked'} (${unlocks.length} item${unlocks.length !== 1 ? 's' : ''})</span>
-            </div>
-            <div class="unlocks-grid">
-              ${unlocks.map(unlock => this._createUnlockCard(level, unlock, levelReached && this._additionalRequirementsMet(unlock.additional_reqs))).join('')}
-            </div>
-          </div>
-        `;
-      }
-    }
+    // The unlock rows themselves are rendered by LifeSkillsUnlockList
+    const unlocksHtml = levels.length === 0
+      ? '<div class="no-unlocks">No unlocks defined for this skill yet.</div>'
+      : '';
 
     return `
       <style>
@@ -564,10 +556,28 @@ class LifeSkillsCard extends HTMLElement {
           padding: 16px 24px 24px 24px;
           max-height: calc(80vh - 200px);
           overflow-y: auto;
+          width: 720px;
+          max-width: calc(90vw - 48px);
+          box-sizing: border-box;
+        }
+
+        .virtual-spacer {
+          position: relative;
         }
 
-        .level-section {
-          margin-bottom: 24px;
+        .virtual-row {
+          position: absolute;
+          top: 0;
+          left: 0;
+          right: 0;
+          padding-bottom: 12px;
+          box-sizing: border-box;
+        }
+
+        .unlocks-loading {
+          color: var(--secondary-text-color);
+          font-style: italic;
+          padding: 8px 16px;
         }
 
         .level-header {
@@ -580,6 +590,12 @@ class LifeSkillsCard extends HTMLElement {
           color: var(--text-primary-color);
           border-radius: var(--ha-card-border-radius, 12px);
           font-weight: 500;
+          cursor: pointer;
+        }
+
+        .level-toggle {
+          width: 12px;
+          color: var(--secondary-text-color);
         }
 
         .level-number {
@@ -601,11 +617,6 @@ class LifeSkillsCard extends HTMLElement {
           opacity: 0.7;
         }
 
-        .unlocks-grid {
-          display: grid;
-          gap: 12px;
-        }
-
         .unlock-card {
           display: flex;
           align-items: center;
@@ -870,15 +881,25 @@ class LifeSkillsCard extends HTMLElement {
     }
   }
 
-  // Resolve a skill's level sensor (sensor.<skill>_level) by display name
+  // Resolve a skill's level sensor (sensor.<skill>_level), or compact XP number,
+  // by display name, preferring the same person's skill (sensor.<person>_<skill>_level)
   _getSkillLevelByName(skillName) {
     if (!this._hass || !skillName) {
       return 0;
     }
     const safe = String(skillName).toLowerCase().replace(/\s+/g, '_');
-    const entityId = `sensor.${safe}_level`;
-    const entity = this._hass.states[entityId];
-    return entity ? (parseInt(entity.state) || 0) : 0;
+    const xpEntity = this._hass.states[this.config.skill];
+    const person = xpEntity && xpEntity.attributes ? xpEntity.attributes.person : null;
+    const prefixes = person ? [`${person.split('.')[1]}_`, ''] : [''];
+    for (const prefix of prefixes) {
+      const number = this._hass.states[`number.${prefix}${safe}_xp`];
+      const compact = number && number.attributes && number.attributes.level !== undefined ? number : null;
+      const entity = this._hass.states[`sensor.${prefix}${safe}_level`] || compact;
+      if (entity) {
+        return skillLevel(entity);
+      }
+    }
+    return 0;
   }
 
   // This method is required for the visual editor to work
@@ -899,6 +920,293 @@ class LifeSkillsCard extends HTMLElement {
   }
 }
 
+// Virtualized list of unlocks for the unlocks dialog. Only the rows around the
+// visible part of the scroll container are kept in the DOM, levels start
+// collapsed and their unlocks are fetched from the backend when expanded.
+class LifeSkillsUnlockList {
+  constructor(container, options) {
+    this.container = container;
+    this.hass = options.hass;
+    this.skillName = options.skillName;
+    this.person = options.person;
+    this.renderUnlock = options.renderUnlock;
+    this.category = 'all';
+    this.expanded = new Set();
+    this.unlocks = new Map();
+    this.heights = new Map();
+    this.elements = new Map();
+    this.rows = [];
+    this.offsets = [0];
+    this._generation = 0;
+    this._frame = null;
+    this._setEntities(options.unlocksEntity, options.levelEntity);
+
+    this.spacer = document.createElement('div');
+    this.spacer.className = 'virtual-spacer';
+    this.container.appendChild(this.spacer);
+
+    this.container.addEventListener('scroll', () => this._scheduleUpdate(), { passive: true });
+    this.spacer.addEventListener('click', (e) => {
+      const header = e.target.closest('.level-header');
+      if (header) {
+        this.toggleLevel(parseInt(header.dataset.level));
+      }
+    });
+
+    // Open the highest level that has been reached
+    const reached = this._levels().filter(level => level <= this.currentLevel);
+    if (reached.length > 0) {
+      this.toggleLevel(reached[reached.length - 1]);
+    } else {
+      this._rebuild();
+    }
+  }
+
+  static get ROW_ESTIMATES() {
+    return { header: 64, loading: 48, unlock: 132 };
+  }
+
+  static get OVERSCAN() {
+    return 400;
+  }
+
+  // Called on every hass update while the dialog is open
+  update(hass, unlocksEntity, levelEntity) {
+    this.hass = hass;
+    if (this._unchanged(unlocksEntity, levelEntity)) {
+      return;
+    }
+
+    // Unlocks or the level changed, so cached levels and rendered rows are stale
+    this._setEntities(unlocksEntity, levelEntity);
+    this._generation += 1;
+    this.unlocks.clear();
+    this.heights.clear();
+    this.elements.forEach(element => element.remove());
+    this.elements.clear();
+    this.expanded.forEach(level => this._load(level));
+    this._rebuild();
+  }
+
+  _unchanged(unlocksEntity, levelEntity) {
+    // A compact skill's entity changes with every grant, only unlock and level changes matter
+    const revision = entity => entity && entity.attributes ? entity.attributes.unlocks_revision : undefined;
+    if (unlocksEntity && revision(unlocksEntity) !== undefined && revision(this.unlocksEntity) !== undefined) {
+      return revision(unlocksEntity) === revision(this.unlocksEntity) && skillLevel(levelEntity) === this.currentLevel;
+    }
+    return unlocksEntity === this.unlocksEntity && levelEntity === this.levelEntity;
+  }
+
+  setCategory(category) {
+    this.category = category;
+    this.container.scrollTop = 0;
+    this._rebuild();
+  }
+
+  toggleLevel(level) {
+    if (this.expanded.has(level)) {
+      this.expanded.delete(level);
+    } else {
+      this.expanded.add(level);
+      this._load(level);
+    }
+    this._rebuild();
+  }
+
+  _setEntities(unlocksEntity, levelEntity) {
+    this.unlocksEntity = unlocksEntity;
+    this.levelEntity = levelEntity;
+    this.summary = unlocksEntity && unlocksEntity.attributes && unlocksEntity.attributes.unlock_summary
+      ? unlocksEntity.attributes.unlock_summary
+      : {};
+    this.currentLevel = skillLevel(levelEntity);
+  }
+
+  _levels() {
+    return Object.keys(this.summary).map(level => parseInt(level)).sort((a, b) => a - b);
+  }
+
+  _count(level) {
+    const categories = this.summary[level.toString()] || {};
+    if (this.category === 'all') {
+      return Object.values(categories).reduce((total, count) => total + count, 0);
+    }
+    return categories[this.category] || 0;
+  }
+
+  async _load(level) {
+    if (this.unlocks.has(level)) {
+      return;
+    }
+
+    const generation = this._generation;
+    this.unlocks.set(level, null);
+    let unlocks = [];
+    try {
+      const message = {
+        type: 'life_skills/unlocks',
+        skill_name: this.skillName,
+        levels: [level],
+      };
+      if (this.person) {
+        message.person = this.person;
+      }
+      const result = await this.hass.callWS(message);
+      unlocks = result.unlocks[level.toString()] || [];
+    } catch (e) {
+      console.error('Failed to load unlocks:', e);
+    }
+
+    // Drop responses that arrived after the unlocks changed again
+    if (generation === this._generation) {
+      this.unlocks.set(level, unlocks);
+      this._rebuild();
+    }
+  }
+
+  // Turn the expanded levels into a flat list of rows and their offsets
+  _rebuild() {
+    const rows = [];
+    for (const level of this._levels()) {
+      const count = this._count(level);
+      if (count === 0) {
+        continue;
+      }
+
+      const expanded = this.expanded.has(level);
+      rows.push({ key: `header:${level}:${this.category}:${expanded}`, type: 'header', level, count, expanded });
+      if (!expanded) {
+        continue;
+      }
+
+      const unlocks = this.unlocks.get(level);
+      if (!unlocks) {
+        rows.push({ key: `loading:${level}`, type: 'loading', level });
+        continue;
+      }
+      unlocks.forEach((unlock, index) => {
+        if (this.category === 'all' || (unlock.category || 'General') === this.category) {
+          rows.push({ key: `unlock:${level}:${index}`, type: 'unlock', level, unlock });
+        }
+      });
+    }
+
+    this.rows = rows;
+    this._layout();
+    this._scheduleUpdate();
+  }
+
+  _layout() {
+    const estimates = LifeSkillsUnlockList.ROW_ESTIMATES;
+    this.offsets = new Array(this.rows.length + 1);
+    this.offsets[0] = 0;
+    this.rows.forEach((row, index) => {
+      this.offsets[index + 1] = this.offsets[index] + (this.heights.get(row.key) || estimates[row.type]);
+    });
+    this.spacer.style.height = `${this.offsets[this.rows.length]}px`;
+  }
+
+  _scheduleUpdate() {
+    if (this._frame === null) {
+      this._frame = requestAnimationFrame(() => {
+        this._frame = null;
+        this._update();
+      });
+    }
+  }
+
+  // Index of the last row starting at or before the given offset
+  _rowAt(offset) {
+    let low = 0;
+    let high = this.rows.length - 1;
+    while (low < high) {
+      const middle = Math.ceil((low + high) / 2);
+      if (this.offsets[middle] <= offset) {
+        low = middle;
+      } else {
+        high = middle - 1;
+      }
+    }
+    return Math.max(0, low);
+  }
+
+  _visibleRows() {
+    const top = this.container.scrollTop - LifeSkillsUnlockList.OVERSCAN;
+    const bottom = this.container.scrollTop + this.container.clientHeight + LifeSkillsUnlockList.OVERSCAN;
+    const visible = new Map();
+    for (let index = this._rowAt(top); index < this.rows.length && this.offsets[index] < bottom; index++) {
+      visible.set(this.rows[index].key, index);
+    }
+    return visible;
+  }
+
+  // Patch the DOM: remove rows that left the viewport, add the ones that entered it
+  _update() {
+    const visible = this._visibleRows();
+
+    for (const [key, element] of this.elements) {
+      if (!visible.has(key)) {
+        element.remove();
+        this.elements.delete(key);
+      }
+    }
+
+    const added = [];
+    for (const [key, index] of visible) {
+      if (!this.elements.has(key)) {
+        const element = this._createRow(this.rows[index]);
+        this.elements.set(key, element);
+        this.spacer.appendChild(element);
+        added.push(key);
+      }
+    }
+
+    // Replace estimated heights with measured ones for rows rendered for the first time
+    let resized = false;
+    for (const key of added) {
+      const height = this.elements.get(key).offsetHeight;
+      if (this.heights.get(key) !== height) {
+        this.heights.set(key, height);
+        resized = true;
+      }
+    }
+    if (resized) {
+      this._layout();
+    }
+
+    for (const [key, index] of visible) {
+      this.elements.get(key).style.transform = `translateY(${this.offsets[index]}px)`;
+    }
+
+    // Measured rows may have made room for more rows in the viewport
+    if (resized) {
+      this._scheduleUpdate();
+    }
+  }
+
+  _createRow(row) {
+    const element = document.createElement('div');
+    element.className = 'virtual-row';
+
+    if (row.type === 'header') {
+      const levelReached = row.level <= this.currentLevel;
+      element.innerHTML = `
+        <div class="level-header" data-level="${row.level}">
+          <span class="level-toggle">${row.expanded ? '▾' : '▸'}</span>
+          <div class="level-number ${levelReached ? 'unlocked' : 'locked'}">Level ${row.level}</div>
+          <span>${levelReached ? 'Unlocked' : 'Locked'} (${row.count} item${row.count !== 1 ? 's' : ''})</span>
+        </div>
+      `;
+    } else if (row.type === 'loading') {
+      element.innerHTML = '<div class="unlocks-loading">Loading…</div>';
+    } else {
+      element.innerHTML = this.renderUnlock(row.level, row.unlock, row.level <= this.currentLevel);
+    }
+
+    return element;
+  }
+}
+
 // Card editor for the visual editor
 class LifeSkillsCardEditor extends HTMLElement {
   constructor() {
@@ -0,0 +1,497 @@
+"""Offline load generator for the Life Skills integration.
+
+Boots a throwaway Home Assistant instance with N skills configured through the
+regular config flow, drives synthetic service traffic against it and reports
+service latency percentiles, event loop lag, state writes per second, the
+bytes written to storage during the test and the size of the stored files.
+
+Everything runs locally: the HTTP server only binds to 127.0.0.1 and the
+configuration only loads the core integrations Life Skills depends on.
+
+Example:
+    python scripts/load_test.py --skills 200 --rate 50 --concurrency 8 --duration 60
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from homeassistant import bootstrap
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.helpers import json as json_helper
+from homeassistant.runner import RuntimeConfig
+
+DOMAIN = "life_skills"
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENT_PATH = os.path.join(REPO_ROOT, "custom_components", DOMAIN)
+
+DEFAULT_MIX = "add_xp=70,set_level=10,add_unlock=15,import_unlocks=5"
+SERVICES = ("add_xp", "set_level", "add_unlock", "import_unlocks")
+UNLOCK_SERVICES = ("add_unlock", "import_unlocks")
+UNLOCK_TIMEOUT = 10
+MAX_SET_LEVEL = 73
+
+CONFIGURATION_YAML = """\
+homeassistant:
+  name: Life Skills load test
+  latitude: 0
+  longitude: 0
+  elevation: 0
+  unit_system: metric
+  time_zone: UTC
+
+http:
+  server_host: 127.0.0.1
+  server_port: {port}
+
+logger:
+  default: warning
+"""
+
+_LOGGER = logging.getLogger("life_skills.load_test")
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """Parse a traffic mix such as ``add_xp=70,set_level=30``."""
+    mix = {}
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        service, _, weight = part.partition("=")
+        service = service.strip()
+        if service not in SERVICES:
+            raise argparse.ArgumentTypeError(f"Unknown service in mix: {service}")
+        try:
+            mix[service] = int(weight)
+        except ValueError as err:
+            raise argparse.ArgumentTypeError(f"Invalid weight for {service}: {weight}") from err
+    if not mix or sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError("Traffic mix must contain a positive weight")
+    return mix
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def skill_name(index: int) -> str:
+    """Return the name of the n-th generated skill."""
+    return f"Load Skill {index:04d}"
+
+
+def _free_port() -> int:
+    """Ask the OS for a free TCP port on the loopback interface."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class StorageWriteCounter:
+    """Count the bytes Home Assistant's storage files are written with.
+
+    Every Store writes through the file helpers of homeassistant.helpers.json,
+    which are wrapped while the counter is active. Writes run in executor
+    threads, so the count is kept under a lock.
+    """
+
+    HELPERS = ("write_utf8_file", "write_utf8_file_atomic")
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.bytes_written = 0
+        self.files: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._originals: Dict[str, Any] = {}
+
+    def _wrap(self, write):
+        """Return a version of a file helper that counts what it writes."""
+        def counting_write(filename, utf8_data, *args, **kwargs):
+            data = utf8_data.encode("utf-8") if isinstance(utf8_data, str) else utf8_data
+            key = os.path.basename(filename)
+            with self._lock:
+                self.bytes_written += len(data)
+                self.files[key] = self.files.get(key, 0) + len(data)
+            return write(filename, utf8_data, *args, **kwargs)
+        return counting_write
+
+    def __enter__(self) -> "StorageWriteCounter":
+        """Start counting."""
+        for name in self.HELPERS:
+            self._originals[name] = getattr(json_helper, name)
+            setattr(json_helper, name, self._wrap(self._originals[name]))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop counting."""
+        for name, write in self._originals.items():
+            setattr(json_helper, name, write)
+
+
+def _storage_size(config_dir: str) -> int:
+    """Return the size of the Life Skills files in the storage directory."""
+    storage_dir = os.path.join(config_dir, ".storage")
+    if not os.path.isdir(storage_dir):
+        return 0
+    return sum(
+        os.path.getsize(os.path.join(storage_dir, filename))
+        for filename in os.listdir(storage_dir)
+        if filename.startswith(DOMAIN)
+    )
+
+
+def prepare_config_dir(config_dir: str) -> None:
+    """Write a minimal offline configuration and link the integration in."""
+    os.makedirs(os.path.join(config_dir, "custom_components"), exist_ok=True)
+    with open(os.path.join(config_dir, "configuration.yaml"), "w", encoding="utf-8") as config_file:
+        config_file.write(CONFIGURATION_YAML.format(port=_free_port()))
+
+    link = os.path.join(config_dir, "custom_components", DOMAIN)
+    if not os.path.exists(link):
+        os.symlink(COMPONENT_PATH, link, target_is_directory=True)
+
+
+async def boot_hass(config_dir: str) -> HomeAssistant:
+    """Start Home Assistant from the prepared configuration directory."""
+    runtime_config = RuntimeConfig(
+        config_dir=config_dir,
+        skip_pip=True,
+        log_file=os.path.join(config_dir, "home-assistant.log"),
+    )
+    hass = await bootstrap.async_setup_hass(runtime_config)
+    if hass is None:
+        raise RuntimeError("Home Assistant failed to boot, see home-assistant.log")
+    await hass.async_start()
+    await hass.async_block_till_done()
+    return hass
+
+
+async def create_skills(hass: HomeAssistant, count: int, compact: bool = False) -> List[str]:
+    """Create the requested number of skills through the config flow."""
+    names = []
+    for index in range(count):
+        name = skill_name(index)
+        result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
+        await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"skill_name": name, "skill_icon": "mdi:star", "compact": compact}
+        )
+        names.append(name)
+    await hass.async_block_till_done()
+    return names
+
+
+class LoadGenerator:
+    """Open-loop traffic generator that records per-call latency.
+
+    Latency is measured from the time a call was due, so time spent waiting
+    for a free slot counts too. Unlock services only fire an event, their
+    latency runs until the skill's unlocks entity shows the change.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        skills: List[str],
+        mix: Dict[str, int],
+        rate: float,
+        concurrency: int,
+        import_size: int,
+        seed: Optional[int],
+        compact: bool = False,
+    ) -> None:
+        """Initialize the generator."""
+        self.hass = hass
+        self.skills = skills
+        self.compact = compact
+        self.rate = rate
+        self.import_size = import_size
+        self._services = list(mix)
+        self._weights = list(mix.values())
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._random = random.Random(seed)
+        self._sequence = 0
+        self.latencies: Dict[str, List[float]] = {service: [] for service in mix}
+        self.errors: Dict[str, int] = {service: 0 for service in mix}
+        self.loop_lag: List[float] = []
+        self.state_writes = 0
+        self._unlock_waiters: Dict[str, Deque[asyncio.Future]] = {}
+
+    def _unlocks_entity_id(self, name: str) -> str:
+        """Return the entity that shows the unlocks of a skill."""
+        slug = name.lower().replace(" ", "_")
+        if self.compact:
+            return f"number.{slug}_xp"
+        return f"sensor.{slug}_unlocks"
+
+    @callback
+    def _handle_state_write(self, event) -> None:
+        """Count a state machine write and finish the oldest unlock call it belongs to."""
+        self.state_writes += 1
+
+        waiters = self._unlock_waiters.get(event.data["entity_id"])
+        if not waiters:
+            return
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        # Compact skills share the entity with XP, only a new revision is an unlock change
+        if (
+            old_state is not None
+            and new_state is not None
+            and "unlocks_revision" in new_state.attributes
+            and old_state.attributes.get("unlocks_revision")
+            == new_state.attributes["unlocks_revision"]
+        ):
+            return
+        # Calls that failed or timed out leave a cancelled waiter behind
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def _unlock(self) -> Dict[str, Any]:
+        """Build a unique synthetic unlock."""
+        self._sequence += 1
+        return {
+            "name": f"Unlock {self._sequence}",
+            "category": self._random.choice(("Stretch", "Workout", "Equipment", "Yoga")),
+            "xp": self._random.randint(1, 100),
+            "description": "Synthetic unlock created by the load generator",
+        }
+
+    def _build_call(self, service: str) -> Dict[str, Any]:
+        """Build service data for the given service."""
+        name = self._random.choice(self.skills)
+        if service == "add_xp":
+            return {"name": name, "amount": self._random.randint(1, 500)}
+        if service == "set_level":
+            # Higher levels need more XP than the number entity accepts
+            return {"name": name, "level": self._random.randint(1, MAX_SET_LEVEL)}
+        if service == "add_unlock":
+            unlock = self._unlock()
+            return {
+                "skill_name": name,
+                "level": self._random.randint(1, 99),
+                "unlock_name": unlock["name"],
+                "category": unlock["category"],
+                "xp": unlock["xp"],
+                "description": unlock["description"],
+            }
+        unlocks_data: Dict[str, List[Dict[str, Any]]] = {}
+        for _ in range(self.import_size):
+            unlocks_data.setdefault(str(self._random.randint(1, 99)), []).append(self._unlock())
+        return {"skill_name": name, "unlocks_data": unlocks_data, "clear_existing": True}
+
+    async def _call(self, service: str, data: Dict[str, Any], due: float) -> None:
+        """Perform one service call and record its latency since it was due."""
+        waiter = None
+        try:
+            if service in UNLOCK_SERVICES:
+                # Registered before the call so the state write can't be missed
+                waiter = self.hass.loop.create_future()
+                entity_id = self._unlocks_entity_id(data["skill_name"])
+                self._unlock_waiters.setdefault(entity_id, deque()).append(waiter)
+            await self.hass.services.async_call(DOMAIN, service, data, blocking=True)
+            if waiter is not None:
+                await asyncio.wait_for(asyncio.shield(waiter), UNLOCK_TIMEOUT)
+            self.latencies[service].append(time.perf_counter() - due)
+        except Exception as err:  # noqa: BLE001 - every failure is reported, none is fatal
+            _LOGGER.debug("%s failed: %s", service, err)
+            self.errors[service] += 1
+            if waiter is not None and not waiter.done():
+                waiter.cancel()
+        finally:
+            self._semaphore.release()
+
+    async def _monitor_loop_lag(self, interval: float) -> None:
+        """Sample how late the event loop wakes up compared to the requested sleep."""
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            self.loop_lag.append(max(0.0, time.perf_counter() - start - interval))
+
+    async def run(self, duration: float) -> float:
+        """Drive traffic for the given number of seconds, return the elapsed time."""
+        unsub = self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._handle_state_write)
+        monitor = asyncio.create_task(self._monitor_loop_lag(0.05))
+        tasks = set()
+        start = time.perf_counter()
+        issued = 0
+        try:
+            while True:
+                due = start + issued / self.rate
+                if due - start >= duration:
+                    break
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await self._semaphore.acquire()
+                service = self._random.choices(self._services, self._weights)[0]
+                task = asyncio.create_task(self._call(service, self._build_call(service), due))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                issued += 1
+            if tasks:
+                await asyncio.gather(*tasks)
+            await self.hass.async_block_till_done()
+        finally:
+            monitor.cancel()
+            unsub()
+        return time.perf_counter() - start
+
+
+def format_report(
+    generator: LoadGenerator,
+    elapsed: float,
+    counter: StorageWriteCounter,
+    storage_size: int,
+) -> Dict[str, Any]:
+    """Summarise the run into a JSON serialisable report."""
+    services = {}
+    all_latencies = []
+    for service, latencies in generator.latencies.items():
+        latencies.sort()
+        all_latencies.extend(latencies)
+        services[service] = {
+            "calls": len(latencies),
+            "errors": generator.errors[service],
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+        }
+    all_latencies.sort()
+    lag = sorted(generator.loop_lag)
+
+    return {
+        "skills": len(generator.skills),
+        "target_rate": generator.rate,
+        "elapsed_s": elapsed,
+        "achieved_rate": len(all_latencies) / elapsed if elapsed else 0.0,
+        "services": services,
+        "latency_ms": {
+            "p50": percentile(all_latencies, 50) * 1000,
+            "p95": percentile(all_latencies, 95) * 1000,
+            "p99": percentile(all_latencies, 99) * 1000,
+        },
+        "loop_lag_ms": {
+            "p50": percentile(lag, 50) * 1000,
+            "p99": percentile(lag, 99) * 1000,
+            "max": (lag[-1] if lag else 0.0) * 1000,
+        },
+        "state_writes_per_s": generator.state_writes / elapsed if elapsed else 0.0,
+        "storage_bytes_written": counter.bytes_written,
+        "life_skills_storage_bytes_written": sum(
+            size for filename, size in counter.files.items() if filename.startswith(DOMAIN)
+        ),
+        "storage_bytes": storage_size,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print a human readable version of the report."""
+    print(f"Skills:              {report['skills']}")
+    print(f"Elapsed:             {report['elapsed_s']:.1f}s")
+    print(f"Rate (target/real):  {report['target_rate']:.1f}/{report['achieved_rate']:.1f} calls/s")
+    print()
+    print(f"{'service':<16}{'calls':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for service, stats in report["services"].items():
+        print(
+            f"{service:<16}{stats['calls']:>8}{stats['errors']:>8}"
+            f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+        )
+    latency = report["latency_ms"]
+    print(
+        f"{'all':<16}{'':>8}{'':>8}"
+        f"{latency['p50']:>10.2f}{latency['p95']:>10.2f}{latency['p99']:>10.2f}"
+    )
+    print()
+    lag = report["loop_lag_ms"]
+    print(f"Event loop lag:      p50 {lag['p50']:.2f}ms  p99 {lag['p99']:.2f}ms  max {lag['max']:.2f}ms")
+    print(f"State writes:        {report['state_writes_per_s']:.1f}/s")
+    print(
+        f"Storage writes:      {report['storage_bytes_written']} bytes"
+        f" ({report['life_skills_storage_bytes_written']} to Life Skills files)"
+    )
+    print(f"Storage footprint:   {report['storage_bytes']} bytes")
+
+
+async def async_main(args: argparse.Namespace) -> Dict[str, Any]:
+    """Boot Home Assistant, generate load and return the report."""
+    config_dir = args.config_dir or tempfile.mkdtemp(prefix="life_skills_load_")
+    prepare_config_dir(config_dir)
+
+    hass = await boot_hass(config_dir)
+    try:
+        skills = await create_skills(hass, args.skills, args.compact)
+        generator = LoadGenerator(
+            hass,
+            skills,
+            args.mix,
+            args.rate,
+            args.concurrency,
+            args.import_size,
+            args.seed,
+            args.compact,
+        )
+        with StorageWriteCounter() as counter:
+            elapsed = await generator.run(args.duration)
+            # Stores write with a delay, stopping runs the final write so every
+            # change made during the run is counted and on disk
+            await hass.async_stop()
+        return format_report(generator, elapsed, counter, _storage_size(config_dir))
+    finally:
+        if hass.state is not CoreState.stopped:
+            await hass.async_stop()
+
+
+def main() -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=50, help="number of skills to configure")
+    parser.add_argument("--rate", type=float, default=20.0, help="service calls per second")
+    parser.add_argument("--concurrency", type=int, default=4, help="maximum calls in flight")
+    parser.add_argument("--duration", type=float, default=30.0, help="test duration in seconds")
+    parser.add_argument(
+        "--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+        help=f"weighted service mix (default: {DEFAULT_MIX})",
+    )
+    parser.add_argument(
+        "--import-size", type=int, default=50, help="unlocks per import_unlocks call"
+    )
+    parser.add_argument(
+        "--compact", action="store_true", help="configure skills as a single entity each"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="random seed for repeatable runs")
+    parser.add_argument(
+        "--config-dir", default=None, help="configuration directory (default: a new temp dir)"
+    )
+    parser.add_argument("--json", dest="json_path", default=None, help="also write the report here")
+    args = parser.parse_args()
+
+    if args.skills < 1 or args.rate <= 0 or args.concurrency < 1 or args.duration <= 0:
+        parser.error("--skills, --rate, --concurrency and --duration must be positive")
+
+    report = asyncio.run(async_main(args))
+    print_report(report)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as json_file:
+            json.dump(report, json_file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())